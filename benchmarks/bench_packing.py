@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Chunk Packing Benchmark - throughput of tiny chunks at several pack sizes
+
+Analyzes a line-per-record corpus (one short sentence per chunk, as
+TextParser produces for files with a blank line between records) with
+every --targets pack size and reports chunks/sec, the number of analysis
+texts, entity recall and how many chunks got results (spans or scores)
+that differ from unpacked analysis (target 0). Uses the same generated corpus and recall
+measure as bench_profiles.py.
+
+    python benchmarks/bench_packing.py --chunks 5000 --targets 0 500 2000 8000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from bench_profiles import ENTITIES, generate_corpus, load_corpus, recall  # noqa: E402
+from redaction_system.redactor import PresidioRedactor, NLP_PROFILES  # noqa: E402
+from redaction_system.redactor.packing import PACK_CHARS, analyze_packed, pack_texts  # noqa: E402
+
+
+def spans(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chunks', type=int, default=2000, help='Generated corpus size')
+    parser.add_argument('--corpus', type=Path, default=None, help='Labeled JSONL corpus')
+    parser.add_argument('--profile', default='fast', choices=list(NLP_PROFILES))
+    parser.add_argument('--targets', type=int, nargs='+', default=[0, 500, PACK_CHARS, 8000],
+                        help='Pack sizes in characters (0 = unpacked)')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else generate_corpus(args.chunks)
+    texts = [doc["text"] for doc in corpus]
+
+    redactor = PresidioRedactor(profile=args.profile)
+    try:
+        redactor.analyzer  # load the model outside the timed section
+    except (OSError, SystemExit) as e:
+        sys.exit(f"model {redactor.profile.model} unavailable ({e})")
+
+    baseline = None
+    rows = []
+    for target in [0] + [t for t in args.targets if t != 0]:
+        start = time.perf_counter()
+        predictions = analyze_packed(redactor, texts, ENTITIES, score_threshold=0.1, target_chars=target)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = predictions
+        units = len(pack_texts(texts, target)) if target > 0 else len(texts)
+        changed = sum(spans(a) != spans(b) for a, b in zip(predictions, baseline))
+        rows.append((target, len(texts) / elapsed, units, recall(corpus, predictions), changed))
+
+    print()
+    print("📊 CHUNK PACKING BENCHMARK")
+    print("=" * 60)
+    print(f"Corpus: {len(texts)} chunks, avg {sum(map(len, texts)) / len(texts):.0f} chars, profile {args.profile}")
+    for target, throughput, units, rec, changed in rows:
+        label = "unpacked" if target == 0 else f"{target} chars"
+        print(f"{label:<12} {throughput:9.1f} chunks/sec   {units:6d} texts   recall {rec:6.1%}   {changed} chunks differ")
+
+
+if __name__ == '__main__':
+    main()
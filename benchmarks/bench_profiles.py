@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""NLP Profile Benchmark - throughput and recall of fast / balanced / accurate
+
+Runs every profile over a labeled reference corpus and reports chunks/sec
+and entity recall (a gold span counts as found if a result of the same
+type overlaps it). The default corpus is generated from templates; pass
+--corpus with a JSONL file of {"text": ..., "entities": [{"start", "end",
+"type"}]} to use real documents. Profiles whose spaCy model is not
+installed are skipped.
+
+    python benchmarks/bench_profiles.py --chunks 300
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from redaction_system.redactor import PresidioRedactor, NLP_PROFILES  # noqa: E402
+
+ENTITIES = ["PERSON", "LOCATION", "ORGANIZATION", "EMAIL_ADDRESS", "PHONE_NUMBER"]
+
+TEMPLATES = [
+    "{PERSON} moved to {LOCATION} last year to join {ORGANIZATION} as a senior analyst.",
+    "Please forward the signed contract to {PERSON} at {EMAIL_ADDRESS} before Friday.",
+    "For delivery issues call {PERSON} on {PHONE_NUMBER} or write to {EMAIL_ADDRESS}.",
+    "The audit of {ORGANIZATION} was led by {PERSON}, who is based in {LOCATION}.",
+    "Meeting notes: {PERSON} and {PERSON} agreed to open an office in {LOCATION}.",
+    "Invoice queries for {ORGANIZATION} go to {EMAIL_ADDRESS}, phone {PHONE_NUMBER}.",
+]
+
+VALUES = {
+    "PERSON": ["John Smith", "Priya Sharma", "Maria Garcia", "David Miller", "Anita Desai", "Robert Brown"],
+    "LOCATION": ["London", "Mumbai", "New York", "Berlin", "Bangalore", "Chicago"],
+    "ORGANIZATION": ["Microsoft", "Tata Consultancy Services", "Goldman Sachs", "Infosys", "Deloitte"],
+    "EMAIL_ADDRESS": ["john.smith@example.com", "priya@acme.in", "billing@contoso.org"],
+    "PHONE_NUMBER": ["(212) 555-0142", "+1 415 555 0199", "020 7946 0018"],
+}
+
+
+def generate_corpus(n, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        template = rng.choice(TEMPLATES)
+        text, entities = "", []
+        for literal, field in _split(template):
+            text += literal
+            if field:
+                value = rng.choice(VALUES[field])
+                entities.append({"start": len(text), "end": len(text) + len(value), "type": field})
+                text += value
+        corpus.append({"text": text, "entities": entities})
+    return corpus
+
+
+def _split(template):
+    """[(literal, field or None), ...] for a "{FIELD}" template"""
+    parts = []
+    while "{" in template:
+        literal, rest = template.split("{", 1)
+        field, template = rest.split("}", 1)
+        parts.append((literal, field))
+    parts.append((template, None))
+    return parts
+
+
+def load_corpus(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def recall(corpus, predictions):
+    found = total = 0
+    for doc, results in zip(corpus, predictions):
+        for gold in doc["entities"]:
+            total += 1
+            found += any(
+                r.entity_type == gold["type"] and r.start < gold["end"] and gold["start"] < r.end
+                for r in results
+            )
+    return found / total if total else 0.0
+
+
+def run_profile(name, corpus):
+    redactor = PresidioRedactor(profile=name)
+    try:
+        redactor.analyzer  # load the model outside the timed section
+    except (OSError, SystemExit) as e:
+        return None, f"model {redactor.profile.model} unavailable ({e})"
+
+    start = time.perf_counter()
+    predictions = redactor.analyze_batch((doc["text"] for doc in corpus), ENTITIES)
+    elapsed = time.perf_counter() - start
+    return (len(corpus) / elapsed, recall(corpus, predictions)), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chunks', type=int, default=200, help='Generated corpus size')
+    parser.add_argument('--corpus', type=Path, default=None, help='Labeled JSONL corpus')
+    parser.add_argument('--profiles', nargs='+', default=list(NLP_PROFILES), choices=list(NLP_PROFILES))
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else generate_corpus(args.chunks)
+
+    rows = []
+    for name in args.profiles:
+        stats, error = run_profile(name, corpus)
+        rows.append((name, stats, error))
+
+    print()
+    print("📊 NLP PROFILE BENCHMARK")
+    print("=" * 60)
+    print(f"Corpus: {len(corpus)} chunks, {sum(len(d['entities']) for d in corpus)} labeled entities")
+    for name, stats, error in rows:
+        if stats is None:
+            print(f"{name:<10} skipped: {error}")
+        else:
+            throughput, rec = stats
+            print(f"{name:<10} {throughput:8.1f} chunks/sec   recall {rec:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Startup Benchmark - cold-start cost of the CLI and of a regex-only job
+
+Each scenario runs in a fresh interpreter so import and model-load costs are
+measured the way a user pays them. Use --max-* to fail (exit 1) when a
+scenario regresses past a budget, e.g. in CI:
+
+    python benchmarks/bench_startup.py --runs 5 --max-version 0.5 --max-regex-job 3
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / 'src')
+
+SCENARIOS = {
+    # `redact --version`: must not import Presidio, spaCy, textual, pandas...
+    'version': [sys.executable, '-m', 'redaction_system.cli.commands', '--version'],
+    # Importing the pipeline (Presidio + spaCy library, no model)
+    'import': [sys.executable, '-c', 'import redaction_system.orchestrator'],
+    # Plain .txt job with regex-only entities: must never load a spaCy model
+    'regex-job': [sys.executable, '-c', '''
+import sys, tempfile
+from pathlib import Path
+from redaction_system.orchestrator import Orchestrator
+tmp = Path(tempfile.mkdtemp())
+src = tmp / 'in.txt'
+src.write_text("PAN ABCPE1234F\\n\\nmail john@example.com\\n")
+o = Orchestrator(use_verdict_cache=False)
+o.redact_file(str(src), "redact PAN and emails", str(tmp / 'out.txt'))
+assert o.redactor._analyzer is None, "spaCy model was loaded for a regex-only job"
+'''],
+}
+
+
+def time_scenario(cmd, env):
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd[:3])} failed:\n{proc.stderr}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    for name in SCENARIOS:
+        parser.add_argument(f'--max-{name}', type=float, default=None, help=f'Budget in seconds for "{name}"')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC + os.pathsep + env.get('PYTHONPATH', '')
+    env['REDACTION_CACHE_DIR'] = tempfile.mkdtemp()
+
+    print("🚀 STARTUP BENCHMARK")
+    print("=" * 60)
+    failed = False
+    for name, cmd in SCENARIOS.items():
+        times = [time_scenario(cmd, env) for _ in range(args.runs)]
+        median = statistics.median(times)
+        budget = getattr(args, f'max_{name.replace("-", "_")}')
+        status = ""
+        if budget is not None:
+            ok = median <= budget
+            failed |= not ok
+            status = f"  {'✅' if ok else '❌'} budget {budget:.2f}s"
+        print(f"{name:<12} median {median:6.2f}s  (min {min(times):.2f}s, max {max(times):.2f}s){status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,12 @@
-from .prompt_interpreter import interpret_prompt, validate_candidates, EntityConfig
+from .prompt_interpreter import (
+    interpret_prompt, validate_candidates, validate_candidate_batches, batch_candidates, EntityConfig
+)
+from .llm_client import OllamaClient, LLMUnavailableError, get_client
+from .cache import VerdictCache, PromptCache
+from .intent_matcher import match_prompt
 
-__all__ = ['interpret_prompt', 'validate_candidates', 'EntityConfig']
\ No newline at end of file
+__all__ = [
+    'interpret_prompt', 'validate_candidates', 'validate_candidate_batches', 'batch_candidates', 'EntityConfig',
+    'OllamaClient', 'LLMUnavailableError', 'get_client', 'VerdictCache',
+    'PromptCache', 'match_prompt'
+]
\ No newline at end of file
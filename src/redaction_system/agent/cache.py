@@ -0,0 +1,192 @@
+"""Persistent LLM Caches - SQLite-backed, size-bounded (LRU)"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def default_cache_dir() -> Path:
+    """$REDACTION_CACHE_DIR, or ~/.cache/redaction_system"""
+    return Path(os.getenv("REDACTION_CACHE_DIR", Path.home() / ".cache" / "redaction_system"))
+
+
+class SQLiteLRUCache:
+    """
+    Key/value store in a single SQLite table with LRU eviction.
+
+    Entries carry a `last_used` timestamp that is refreshed on every hit;
+    when the table grows past `max_entries` the least recently used rows
+    are deleted. Safe to share between threads, and between processes
+    (WAL mode) for parallel runs.
+    """
+
+    def __init__(self, path: Path, table: str, max_entries: int = 100_000):
+        self.path = Path(path)
+        self.table = table
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._touched = {}  # key -> last_used, flushed with the next write
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Opened lazily, and reopened in forked worker processes - a SQLite
+        # handle must never be shared across fork
+        if self._conn is not None and self._conn_pid != os.getpid():
+            self._conn = None
+            self._touched = {}
+        if self._conn is None:
+            self._conn_pid = os.getpid()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_lru ON {self.table}(last_used)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            return row[0]
+
+    def put_many(self, items: Iterable[Tuple[str, str]]):
+        now = time.time()
+        rows = [(key, value, now) for key, value in items]
+        with self._lock:
+            self._flush_touched()
+            if rows:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, last_used) VALUES (?, ?, ?)", rows
+                )
+                self._evict()
+            self.conn.commit()
+
+    def put(self, key: str, value: str):
+        self.put_many([(key, value)])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def flush(self):
+        """Persist LRU timestamps of recent hits"""
+        with self._lock:
+            if self._touched:
+                self._flush_touched()
+                self.conn.commit()
+
+    def _flush_touched(self):
+        if self._touched:
+            self.conn.executemany(
+                f"UPDATE {self.table} SET last_used = ? WHERE key = ?",
+                [(ts, key) for key, ts in self._touched.items()]
+            )
+            self._touched = {}
+
+    def _evict(self):
+        count = self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY last_used ASC LIMIT ?)",
+                (excess,)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        self.flush()
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\W+", " ", text.casefold()).strip()
+
+
+class VerdictCache(SQLiteLRUCache):
+    """
+    Job 2 verdicts keyed by (normalized text, entity type, context fingerprint, model).
+
+    The context fingerprint is the candidate's context window with the
+    candidate itself removed, so the same letterhead name or account number
+    in the same surroundings hits the cache across files.
+    """
+
+    def __init__(self, path: Path = None, max_entries: int = None):
+        if max_entries is None:
+            max_entries = int(os.getenv("REDACTION_VERDICT_CACHE_SIZE", 100_000))
+        super().__init__(path or default_cache_dir() / "verdicts.sqlite3", "verdicts", max_entries)
+
+    @staticmethod
+    def make_key(candidate: Dict, model: str) -> str:
+        text = candidate.get('text', '')
+        context = candidate.get('context', '').replace(text, ' ')
+        fingerprint = hashlib.sha256(_normalize(context).encode('utf-8')).hexdigest()[:16]
+        raw = "\x1f".join([_normalize(text), candidate.get('entity_type', ''), fingerprint, model or ''])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get_verdict(self, candidate: Dict, model: str) -> Optional[bool]:
+        """True/False if a verdict is cached, None on a miss"""
+        value = self.get(self.make_key(candidate, model))
+        return None if value is None else value == "1"
+
+    def put_verdicts(self, items: Iterable[Tuple[Dict, bool]], model: str):
+        """Store [(candidate, verdict), ...] for `model`"""
+        self.put_many(
+            (self.make_key(candidate, model), "1" if verdict else "0") for candidate, verdict in items
+        )
+
+
+class PromptCache(SQLiteLRUCache):
+    """
+    Job 1 interpretations keyed by (normalized prompt, model).
+
+    Backed by an in-process memo so a directory run asks SQLite (and the
+    LLM) at most once per prompt.
+    """
+
+    def __init__(self, path: Path = None, max_entries: int = 10_000):
+        super().__init__(path or default_cache_dir() / "prompts.sqlite3", "prompts", max_entries)
+        self._memo = {}
+
+    @staticmethod
+    def make_key(normalized_prompt: str, model: str) -> str:
+        raw = "\x1f".join([normalized_prompt, model or ''])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get_entities(self, normalized_prompt: str, model: str) -> Optional[List[str]]:
+        key = self.make_key(normalized_prompt, model)
+        if key in self._memo:
+            self.hits += 1
+            return list(self._memo[key])
+        value = self.get(key)
+        if value is None:
+            return None
+        self._memo[key] = json.loads(value)
+        return list(self._memo[key])
+
+    def put_entities(self, normalized_prompt: str, model: str, entities: List[str]):
+        key = self.make_key(normalized_prompt, model)
+        self._memo[key] = list(entities)
+        self.put(key, json.dumps(entities))
@@ -0,0 +1,130 @@
+"""Deterministic Job 1 fast path - keyword/synonym matching over the supported entity types"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+ALL_ENTITIES = [
+    "PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "US_SSN",
+    "CREDIT_CARD", "DATE_TIME", "ORGANIZATION",
+    "IP_ADDRESS", "URL", "LOCATION",
+    "PAN", "AADHAAR", "BANK_ACCOUNT", "IFSC", "GST_REGISTRATION", "CIN"
+]
+
+PERSONAL = ["PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "LOCATION"]
+CONTACT = ["EMAIL_ADDRESS", "PHONE_NUMBER", "LOCATION"]
+FINANCIAL = ["CREDIT_CARD", "US_SSN", "BANK_ACCOUNT", "IFSC", "PAN"]
+
+# Phrases (singularized tokens) -> entity types. Longest phrase wins.
+SYNONYMS: Dict[Tuple[str, ...], List[str]] = {
+    # Single entity types
+    ("name",): ["PERSON"], ("person",): ["PERSON"], ("people",): ["PERSON"],
+    ("individual",): ["PERSON"], ("employee", "name"): ["PERSON"],
+    ("email",): ["EMAIL_ADDRESS"], ("e", "mail"): ["EMAIL_ADDRESS"], ("mail", "id"): ["EMAIL_ADDRESS"],
+    ("email", "address"): ["EMAIL_ADDRESS"], ("e", "mail", "address"): ["EMAIL_ADDRESS"],
+    ("phone",): ["PHONE_NUMBER"], ("telephone",): ["PHONE_NUMBER"], ("mobile",): ["PHONE_NUMBER"],
+    ("cell", "phone"): ["PHONE_NUMBER"], ("contact", "number"): ["PHONE_NUMBER"],
+    ("ssn",): ["US_SSN"], ("social", "security"): ["US_SSN"],
+    ("credit", "card"): ["CREDIT_CARD"], ("debit", "card"): ["CREDIT_CARD"],
+    ("payment", "card"): ["CREDIT_CARD"],
+    ("date",): ["DATE_TIME"], ("timestamp",): ["DATE_TIME"],
+    ("date", "of", "birth"): ["DATE_TIME"], ("dob",): ["DATE_TIME"],
+    ("organization",): ["ORGANIZATION"], ("organisation",): ["ORGANIZATION"],
+    ("company",): ["ORGANIZATION"], ("institution",): ["ORGANIZATION"], ("org",): ["ORGANIZATION"],
+    ("ip",): ["IP_ADDRESS"], ("ip", "address"): ["IP_ADDRESS"],
+    ("url",): ["URL"], ("website",): ["URL"], ("link",): ["URL"], ("web", "address"): ["URL"],
+    ("location",): ["LOCATION"], ("place",): ["LOCATION"], ("address",): ["LOCATION"],
+    ("city",): ["LOCATION"], ("country",): ["LOCATION"],
+    ("pan",): ["PAN"], ("pan", "card"): ["PAN"], ("permanent", "account", "number"): ["PAN"],
+    ("aadhaar",): ["AADHAAR"], ("aadhar",): ["AADHAAR"], ("uid",): ["AADHAAR"],
+    ("aadhaar", "card"): ["AADHAAR"], ("aadhar", "card"): ["AADHAAR"],
+    ("bank", "account"): ["BANK_ACCOUNT"], ("account", "number"): ["BANK_ACCOUNT"],
+    ("account",): ["BANK_ACCOUNT"], ("a", "c"): ["BANK_ACCOUNT"],
+    ("ifsc",): ["IFSC"], ("bank", "code"): ["IFSC"], ("branch", "code"): ["IFSC"],
+    ("gst",): ["GST_REGISTRATION"], ("gstin",): ["GST_REGISTRATION"],
+    ("cin",): ["CIN"], ("corporate", "identification", "number"): ["CIN"],
+
+    # Groups (mirrors the guidance in the Job 1 system prompt)
+    ("personal",): PERSONAL, ("identity",): PERSONAL,
+    ("contact",): CONTACT,
+    ("financial",): FINANCIAL, ("payment",): FINANCIAL, ("banking",): FINANCIAL,
+    ("everything",): ALL_ENTITIES,
+}
+
+# Mean "everything" on their own, but only qualify a more specific request ("financial PII")
+GENERIC = {"pii", "private", "sensitive", "confidential"}
+
+# Words that carry no entity meaning on their own
+FILLERS = {
+    "redact", "hide", "remove", "mask", "anonymize", "anonymise", "scrub", "strip", "censor",
+    "obfuscate", "blank", "delete", "replace", "protect", "find", "detect",
+    "all", "and", "or", "the", "a", "an", "any", "every", "of", "in", "from", "this", "these",
+    "document", "file", "text", "report", "please", "their", "them", "with", "also", "plus",
+    "type", "kind", "entity", "only",
+}
+
+# Generic qualifiers only accepted next to a recognised entity ("PAN number")
+QUALIFIERS = {"number", "no", "num", "detail", "info", "information", "data", "id", "code", "value"}
+
+# Intent the matcher can't represent - always defer to the LLM
+NEGATIONS = {"except", "but", "not", "dont", "don", "keep", "leave", "without", "excluding", "exclude"}
+
+_MAX_PHRASE = max(len(k) for k in SYNONYMS)
+
+# Matched as written: "this" must not become "thi"
+_KNOWN_WORDS = FILLERS | QUALIFIERS | GENERIC | NEGATIONS
+
+
+def _singular(token: str) -> str:
+    if token in _KNOWN_WORDS:
+        return token
+    if len(token) > 3 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith("sses"):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lower-case, punctuation-free, whitespace-collapsed prompt (also used as a cache key)"""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", prompt.lower()).split())
+
+
+def match_prompt(prompt: str) -> Optional[List[str]]:
+    """
+    Resolve a redaction prompt to entity types without the LLM.
+
+    Only succeeds when every word is understood (an entity synonym, a filler
+    verb/article, or a qualifier next to an entity); anything else - unknown
+    words, negations like "except names" - returns None so the caller can
+    ask the LLM.
+
+    Returns: Entity types in canonical order, or None
+    """
+    tokens = [_singular(t) for t in normalize_prompt(prompt).split()]
+    if not tokens or any(t in NEGATIONS for t in tokens):
+        return None
+
+    found = set()
+    generic = False
+    leftovers = []
+    i = 0
+    while i < len(tokens):
+        for size in range(min(_MAX_PHRASE, len(tokens) - i), 0, -1):
+            phrase = tuple(tokens[i:i + size])
+            if phrase in SYNONYMS:
+                found.update(SYNONYMS[phrase])
+                i += size
+                break
+        else:
+            if tokens[i] in GENERIC:
+                generic = True
+            elif tokens[i] not in FILLERS:
+                leftovers.append(tokens[i])
+            i += 1
+
+    if not found and generic:
+        found.update(ALL_ENTITIES)
+    if not found or any(t not in QUALIFIERS for t in leftovers):
+        return None
+    return [e for e in ALL_ENTITIES if e in found]
@@ -0,0 +1,211 @@
+"""Ollama Client - Pooled, concurrent, retrying access to /api/generate"""
+import os
+import time
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised when Ollama can't answer: circuit open, time budget spent or retries exhausted"""
+
+
+# Every client, so forked worker processes can reset them (see _after_fork_in_child)
+_live_clients = weakref.WeakSet()
+
+
+class OllamaClient:
+    """
+    Reusable Ollama client shared by Job 1 and Job 2.
+
+    - One keep-alive `requests.Session` (connection pool sized to concurrency)
+    - `keep_alive` hint so the model stays loaded between calls
+    - Bounded concurrent in-flight requests via a thread pool (`map`)
+    - Retry with exponential backoff on connection errors, timeouts and 5xx
+    - Optional per-file time budget (`time_budget`)
+    - Circuit breaker: after N consecutive failures calls fail fast for a
+      cooldown period, so callers drop to their fallback immediately
+    """
+
+    def __init__(self, host: str = None, model: str = None, max_concurrency: int = 4,
+                 timeout: float = 30, max_retries: int = 2, backoff: float = 0.5,
+                 keep_alive: str = "10m", failure_threshold: int = 3, reset_after: float = 60):
+        self.host = host or os.getenv("OLLAMA_HOST")
+        self.model = model or os.getenv("OLLAMA_MODEL")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.keep_alive = keep_alive
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+
+        self._open_session()
+        self._executor = None
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._deadline = None
+        _live_clients.add(self)
+
+    def _open_session(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _reset_after_fork(self):
+        """In a forked child: drop the parent's sockets, threads and locks"""
+        self._open_session()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    # --- Time budget -------------------------------------------------------
+
+    @contextmanager
+    def time_budget(self, seconds: Optional[float]):
+        """Limit total LLM wall-clock time for the enclosed block (None = unlimited)"""
+        previous = self._deadline
+        self._deadline = time.monotonic() + seconds if seconds else None
+        try:
+            yield self
+        finally:
+            self._deadline = previous
+
+    def _remaining(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return self._deadline - time.monotonic()
+
+    # --- Circuit breaker ---------------------------------------------------
+
+    @property
+    def circuit_open(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if time.monotonic() - self._opened_at >= self.reset_after:
+                # Half-open: let the next call probe Ollama again
+                self._opened_at = None
+                self._failures = self.failure_threshold - 1
+                return False
+            return True
+
+    def _record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold and self._opened_at is None:
+                self._opened_at = time.monotonic()
+                print(f"⚠️  Ollama circuit open for {self.reset_after:.0f}s after {self._failures} failures")
+
+    # --- Requests ----------------------------------------------------------
+
+    def generate(self, prompt: str, options: Dict = None, format: str = "json") -> str:
+        """
+        Call /api/generate and return the `response` string.
+
+        Raises:
+            LLMUnavailableError: circuit open, budget exhausted or all retries failed
+        """
+        if not self.host:
+            raise LLMUnavailableError("OLLAMA_HOST is not set")
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": self.keep_alive,
+            "options": options or {}
+        }
+        if format:
+            payload["format"] = format
+
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if self.circuit_open:
+                raise LLMUnavailableError("Ollama circuit open")
+
+            remaining = self._remaining()
+            if remaining is not None and remaining <= 0:
+                raise LLMUnavailableError("LLM time budget exhausted")
+            timeout = self.timeout if remaining is None else min(self.timeout, remaining)
+
+            try:
+                response = self.session.post(f"{self.host}/api/generate", json=payload, timeout=timeout)
+                if response.status_code >= 500:
+                    raise requests.HTTPError(f"{response.status_code} Server Error", response=response)
+                response.raise_for_status()
+                result = response.json()
+                self._record_success()
+                return result["response"]
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                last_error = e
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                self._record_failure()
+                if status is not None and status < 500:
+                    break  # client errors won't get better on retry
+                if attempt < self.max_retries:
+                    delay = self.backoff * (2 ** attempt)
+                    remaining = self._remaining()
+                    if remaining is not None:
+                        delay = min(delay, max(0.0, remaining))
+                    time.sleep(delay)
+
+        raise LLMUnavailableError(f"Ollama request failed: {last_error}")
+
+    def map(self, fn: Callable, items: Iterable) -> List:
+        """Run `fn` over `items` with at most `max_concurrency` in flight; results keep input order"""
+        items = list(items)
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [fn(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="ollama")
+        return list(self._executor.map(fn, items))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> OllamaClient:
+    """Process-wide default client configured from the environment"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = OllamaClient(
+                max_concurrency=int(os.getenv("OLLAMA_MAX_CONCURRENCY", 4)),
+                timeout=float(os.getenv("OLLAMA_TIMEOUT", 30)),
+                max_retries=int(os.getenv("OLLAMA_MAX_RETRIES", 2)),
+                keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", "10m"),
+            )
+        return _default_client
+
+
+def _after_fork_in_child():
+    global _default_lock
+    _default_lock = threading.Lock()
+    for client in list(_live_clients):
+        client._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,27 +1,71 @@
 from dataclasses import dataclass
 from typing import List, Dict
-import requests
 import json
-import os
 from dotenv import load_dotenv
+from .llm_client import OllamaClient, get_client
+from .cache import VerdictCache, PromptCache
+from .intent_matcher import match_prompt, normalize_prompt, ALL_ENTITIES
 
 load_dotenv()
 
+_prompt_cache = None
+
+
+def get_prompt_cache() -> PromptCache:
+    """Process-wide persistent cache of Job 1 interpretations"""
+    global _prompt_cache
+    if _prompt_cache is None:
+        _prompt_cache = PromptCache()
+    return _prompt_cache
+
 @dataclass
 class EntityConfig:
     entities: List[str]
     confidence: float = 0.95
     reasoning: str = ""
 
-def interpret_prompt(user_input: str) -> EntityConfig:
+def interpret_prompt(user_input: str, client: OllamaClient = None, cache: PromptCache = None) -> EntityConfig:
+    """
+    Job 1: Resolve the user's redaction intent to entity types.
+    
+    1. Deterministic keyword/synonym match (no LLM, identical every run)
+    2. Persistent cache of earlier LLM answers for the same prompt + model
+    3. LLM interpretation, stored in the cache unless it fell back
+    """
+    client = client or get_client()
+    
+    matched = match_prompt(user_input)
+    if matched:
+        print(f"Keyword match: {matched}")
+        return EntityConfig(
+            entities=matched,
+            confidence=1.0,
+            reasoning=f"Keyword match: {user_input}"
+        )
+    
+    cache = cache or get_prompt_cache()
+    normalized = normalize_prompt(user_input)
+    cached = cache.get_entities(normalized, client.model)
+    if cached is not None:
+        print(f"Cached interpretation: {cached}")
+        return EntityConfig(
+            entities=cached,
+            confidence=0.95,
+            reasoning=f"Cached: {user_input}"
+        )
+    
+    config = _interpret_with_llm(user_input, client)
+    if config.confidence > 0:
+        cache.put_entities(normalized, client.model, config.entities)
+    return config
+
+
+def _interpret_with_llm(user_input: str, client: OllamaClient) -> EntityConfig:
     """
     Intelligently interpret user's redaction intent.
     FLEXIBLE - handles many variations naturally.
     """
     
-    ollama_host = os.getenv("OLLAMA_HOST")
-    model = os.getenv("OLLAMA_MODEL")
-    
     # SMART system prompt (context + reasoning, not hardcoded rules)
     system_prompt = """You are an expert PII identification system.
 
@@ -65,27 +109,17 @@ Examples: ["PERSON"], ["EMAIL_ADDRESS", "PHONE_NUMBER"], ["PERSON", "EMAIL_ADDRE
 
 If nothing matches: []"""
 
-    payload = {
-        "model": model,
-        "prompt": f"{system_prompt}\n\nUser request: {user_input}",
-        "stream": False,
-        "format": "json",  # Force JSON mode if supported by the model version
-        "options": {
-            "temperature": 0.1,  # Low = consistent, not random
-            "num_predict": 100
-        }
+    options = {
+        "temperature": 0.1,  # Low = consistent, not random
+        "num_predict": 100
     }
     
     try:
-        response = requests.post(
-            f"{ollama_host}/api/generate", 
-            json=payload, 
-            timeout=30
-        )
-        response.raise_for_status()
-        
-        result = response.json()
-        entities_str = result['response'].strip()
+        entities_str = client.generate(
+            f"{system_prompt}\n\nUser request: {user_input}",
+            options=options,
+            format="json"  # Force JSON mode if supported by the model version
+        ).strip()
         
         print(f"LLM Response: {entities_str}")
 
@@ -136,13 +170,7 @@ If nothing matches: []"""
              entities = [str(entities)]
 
         # Validate (only keep valid entity types)
-        valid_entities = [
-            "PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "US_SSN", 
-            "CREDIT_CARD", "DATE_TIME", "ORGANIZATION", 
-            "IP_ADDRESS", "URL", "LOCATION", 
-            "PAN", "AADHAAR", "BANK_ACCOUNT", "IFSC", "GST_REGISTRATION", "CIN"
-        ]
-        filtered_entities = [e for e in entities if e in valid_entities]
+        filtered_entities = [e for e in entities if e in ALL_ENTITIES]
         
         return EntityConfig(
             entities=filtered_entities if filtered_entities else ["PERSON"],
@@ -158,25 +186,7 @@ If nothing matches: []"""
             reasoning="Fallback"
         )
 
-def validate_candidates(candidates: List[Dict], context_text: str) -> List[int]:
-    """
-    Job 2: Analyst Mode. Review uncertain candidates and return the INDICES of valid ones.
-    
-    Returns: List of integers (indices in the candidates list that are TRUE positives)
-    """
-    if not candidates:
-        return []
-    
-    ollama_host = os.getenv('OLLAMA_HOST')
-    model = os.getenv('OLLAMA_MODEL')
-    
-    # Build candidate descriptions with their IDs
-    candidate_desc = "\n".join([
-        f"- ID: {i}, Text: '{c.get('text')}', Type: {c.get('entity_type')}, Context: '...{c.get('context', 'N/A')}...'"
-        for i, c in enumerate(candidates)
-    ])
-    
-    system_prompt = f"""You are an expert Data Privacy Analyst. Your job is to VALIDATE potential PII candidates.
+VALIDATION_PROMPT = """You are an expert Data Privacy Analyst. Your job is to VALIDATE potential PII candidates.
 
 Presidio flagged these with LOW confidence. Decide if they are TRUE PII based on context.
 
@@ -191,21 +201,123 @@ RULES:
 OUTPUT: JSON array of IDs that are TRUE positives.
 Example: [0, 2, 3]
 """
+
+# Ollama's default context window; larger validation prompts raise num_ctx
+DEFAULT_NUM_CTX = 2048
+DEFAULT_VALIDATION_TOKEN_BUDGET = 2048
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for Llama-style tokenizers)"""
+    return len(text) // 4 + 1
+
+
+def _describe_candidate(i: int, c: Dict) -> str:
+    return f"- ID: {i}, Text: '{c.get('text')}', Type: {c.get('entity_type')}, Context: '...{c.get('context', 'N/A')}...'"
+
+
+def batch_candidates(candidates: List[Dict], token_budget: int = DEFAULT_VALIDATION_TOKEN_BUDGET) -> List[List[int]]:
+    """
+    Pack candidates into as few validation prompts as the token budget allows.
+
+    Returns: List of batches, each a list of indices into `candidates`.
+    A single candidate larger than the budget still gets its own batch.
+    """
+    overhead = estimate_tokens(VALIDATION_PROMPT.format(candidate_desc=""))
+    batches = []
+    current = []
+    used = overhead
+    for i, c in enumerate(candidates):
+        cost = estimate_tokens(_describe_candidate(len(current), c)) + 1
+        if current and used + cost > token_budget:
+            batches.append(current)
+            current = []
+            used = overhead
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def validate_candidate_batches(candidates: List[Dict], token_budget: int = DEFAULT_VALIDATION_TOKEN_BUDGET,
+                               client: OllamaClient = None, cache: VerdictCache = None) -> List[int]:
+    """
+    Job 2 across many chunks: validate candidates in token-budgeted batches.
+
+    Candidates may come from different chunks; the caller keeps the mapping
+    from list position back to its chunk and RecognizerResult. Batches are
+    independent, so they are sent concurrently through the client's pool.
+    If a cache is given, verdicts of batches the LLM answered with a
+    well-formed id list are stored; failed or malformed batches are not
+    cached (their candidates stay unvalidated, and are asked again next time).
+
+    Returns: Sorted list of indices into `candidates` that are TRUE positives
+    """
+    if not candidates:
+        return []
     
-    payload = {
-        'model': model,
-        'prompt': system_prompt,
-        'stream': False,
-        'format': 'json',
-        'options': {'temperature': 0.0}
-    }
+    client = client or get_client()
+    batches = batch_candidates(candidates, token_budget)
+    print(f"   🤖 Validating {len(candidates)} candidates in {len(batches)} LLM call(s)")
+    
+    def run_batch(batch):
+        try:
+            return validate_candidates([candidates[i] for i in batch], "", client=client, raise_errors=True)
+        except Exception:
+            return None
+    
+    verdicts = client.map(run_batch, batches)
+    
+    valid = []
+    for batch, batch_indices in zip(batches, verdicts):
+        if batch_indices is None:
+            continue
+        valid.extend(batch[i] for i in batch_indices)
+        if cache is not None:
+            accepted = set(batch_indices)
+            cache.put_verdicts(
+                [(candidates[i], j in accepted) for j, i in enumerate(batch)],
+                client.model
+            )
+    return sorted(set(valid))
+
+
+def validate_candidates(candidates: List[Dict], context_text: str, client: OllamaClient = None,
+                        raise_errors: bool = False) -> List[int]:
+    """
+    Job 2: Analyst Mode. Review uncertain candidates and return the INDICES of valid ones.
+    
+    Args:
+        raise_errors: Re-raise LLM failures and malformed answers (anything
+            but a list of candidate ids) instead of returning [] (lets
+            callers tell "nothing valid" apart from "no answer")
+    
+    Returns: List of integers (indices in the candidates list that are TRUE positives)
+    """
+    if not candidates:
+        return []
+    
+    client = client or get_client()
+    
+    # Build candidate descriptions with their IDs
+    candidate_desc = "\n".join([
+        _describe_candidate(i, c)
+        for i, c in enumerate(candidates)
+    ])
+    
+    system_prompt = VALIDATION_PROMPT.format(candidate_desc=candidate_desc)
+    
+    options = {'temperature': 0.0}
+    # Make sure batched prompts are not silently truncated by Ollama
+    needed_ctx = estimate_tokens(system_prompt) + 256
+    if needed_ctx > DEFAULT_NUM_CTX:
+        options['num_ctx'] = 1 << (needed_ctx - 1).bit_length()
     
     try:
-        response = requests.post(f'{ollama_host}/api/generate', json=payload, timeout=30)
-        response.raise_for_status()
-        result = response.json()
+        response_text = client.generate(system_prompt, options=options, format='json')
         
-        valid_ids = json.loads(result['response'].strip())
+        valid_ids = json.loads(response_text.strip())
         
         # Handle if LLM wrapped it in a dict
         if isinstance(valid_ids, dict):
@@ -214,11 +326,10 @@ Example: [0, 2, 3]
                     valid_ids = v
                     break
         
-        if not isinstance(valid_ids, list):
-            valid_ids = []
-        
         # Validate indices are integers in range
-        valid_ids = [i for i in valid_ids if isinstance(i, int) and 0 <= i < len(candidates)]
+        if not isinstance(valid_ids, list) or not all(
+                isinstance(i, int) and not isinstance(i, bool) and 0 <= i < len(candidates) for i in valid_ids):
+            raise ValueError(f"malformed answer, expected a list of candidate ids: {response_text[:200]!r}")
         
         if valid_ids:
             validated_texts = [candidates[i]['text'] for i in valid_ids]
@@ -228,4 +339,6 @@ Example: [0, 2, 3]
         
     except Exception as e:
         print(f"✗ Agent validation failed: {e}")
+        if raise_errors:
+            raise
         return []
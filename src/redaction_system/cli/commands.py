@@ -1,15 +1,33 @@
 #!/usr/bin/env python3
 """CLI Commands for Redaction System"""
 import click
+import json
+from dataclasses import asdict
 from pathlib import Path
 from rich.console import Console
-from rich.progress import track
-from redaction_system.orchestrator import Orchestrator
-from redaction_system.cli.preview import show_preview
+from rich.progress import Progress, MofNCompleteColumn
 from redaction_system.cli.utils import scan_directory, format_error
 
+# Orchestrator (Presidio/spaCy) and the preview (textual) are imported inside
+# the commands that need them, so `--version`/`--help` start instantly.
+PROFILE_NAMES = ['fast', 'balanced', 'accurate']
+
+# Written to the output directory by `redact directory`
+REPORT_NAME = 'redaction_report.json'
+
+# Written next to the output by `redact file` (when there is anything to report)
+FILE_REPORT_SUFFIX = '.report.json'
+
 console = Console()
 
+def column_options(command):
+    """Spreadsheet column profiling options shared by `file` and `directory`"""
+    command = click.option('--always-analyze', multiple=True, metavar='COLUMN',
+                           help='Spreadsheet column never skipped by --column-threshold (repeatable)')(command)
+    command = click.option('--column-threshold', type=click.FloatRange(0, 1), default=None,
+                           help='Skip spreadsheet columns whose sampled PII hit rate is below this (e.g. 0.01)')(command)
+    return command
+
 @click.group()
 @click.version_option(version="0.1.0")
 def main():
@@ -21,39 +39,70 @@ def main():
 @click.option('--prompt', '-p', required=True, help='Redaction instructions (e.g., "redact names")')
 @click.option('--output', '-o', type=click.Path(), help='Output file path (default: <name>_redacted.<ext>)')
 @click.option('--no-preview', is_flag=True, help='Skip preview and redact immediately')
-def file(filepath, prompt, output, no_preview):
+@click.option('--profile', type=click.Choice(PROFILE_NAMES), default=None, help='NLP profile: speed vs. accuracy (default: accurate)')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Worker processes for chunk analysis (default: 1)')
+@click.option('--max-in-flight', type=click.IntRange(min=1), default=None, help='Chunks validated and written at a time; with --no-preview also the max parsed ahead (default: 64)')
+@click.option('--pack-chars', type=click.IntRange(min=0), default=None, help='Analyze small chunks packed into texts of about this size; 0 turns packing off (default: 2000)')
+@column_options
+def file(filepath, prompt, output, no_preview, profile, workers, max_in_flight, pack_chars, column_threshold, always_analyze):
     """Redact a single file"""
     
     console.print(f"\n📁 Processing: [bold cyan]{filepath}[/bold cyan]")
     console.print(f"💬 Prompt: [yellow]{prompt}[/yellow]\n")
     
+    orchestrator = None
     try:
-        orchestrator = Orchestrator()
+        from redaction_system.orchestrator import Orchestrator
+        from redaction_system.cli.preview import show_preview
+        
+        orchestrator = Orchestrator(nlp_profile=profile, workers=workers, max_in_flight=max_in_flight, pack_chars=pack_chars,
+                                    column_skip_threshold=column_threshold, always_analyze_columns=always_analyze)
+        session = None
         
         if not no_preview:
             # Show preview and get user approval
-            approved = show_preview(filepath, prompt, orchestrator)
+            approved, session = show_preview(filepath, prompt, orchestrator)
             if not approved:
                 console.print("[yellow]❌ Redaction cancelled by user[/yellow]")
                 return
         
-        # Execute redaction
+        # Execute redaction (reuses the preview's analysis if available)
         console.print("\n[bold green]🔄 Redacting...[/bold green]")
-        output_path = orchestrator.redact_file(filepath, prompt, output)
+        output_path = orchestrator.redact_file(filepath, prompt, output, session=session)
+        
+        # Same layout as the directory report, e.g. for column skip decisions
+        report_path = None
+        if orchestrator.last_report:
+            report_path = Path(output_path).with_name(Path(output_path).name + FILE_REPORT_SUFFIX)
+            entry = {'path': filepath, 'output_path': output_path, 'report': orchestrator.last_report}
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump({'prompt': prompt, 'files': [entry]}, f, indent=2)
         
         console.print(f"\n[bold green]✅ Complete![/bold green]")
-        console.print(f"📁 Output: [cyan]{output_path}[/cyan]\n")
+        console.print(f"📁 Output: [cyan]{output_path}[/cyan]")
+        if report_path is not None:
+            console.print(f"📝 Report: [cyan]{report_path}[/cyan]")
+        console.print()
         
     except Exception as e:
         format_error(e)
         raise click.Abort()
+    finally:
+        # Also on failure or Ctrl-C: stop the worker pool, flush caches
+        if orchestrator is not None:
+            orchestrator.close()
 
 @main.command()
 @click.argument('dirpath', type=click.Path(exists=True, file_okay=False))
 @click.option('--prompt', '-p', required=True, help='Redaction instructions')
 @click.option('--output', '-o', type=click.Path(), help='Output directory (default: same directory)')
 @click.option('--mode', type=click.Choice(['interactive', 'batch', 'hybrid']), default='batch', help='Processing mode')
-def directory(dirpath, prompt, output, mode):
+@click.option('--profile', type=click.Choice(PROFILE_NAMES), default=None, help='NLP profile: speed vs. accuracy (default: accurate)')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Files processed in parallel (default: 1)')
+@click.option('--force', is_flag=True, help='Re-redact files that are unchanged since the last run')
+@click.option('--resume', is_flag=True, help='Continue an interrupted run where it stopped')
+@column_options
+def directory(dirpath, prompt, output, mode, profile, workers, force, resume, column_threshold, always_analyze):
     """Redact all files in a directory"""
     
     console.print(f"\n📁 Scanning: [bold cyan]{dirpath}[/bold cyan]")
@@ -75,37 +124,80 @@ def directory(dirpath, prompt, output, mode):
         return
     
     # Process files
-    orchestrator = Orchestrator()
+    from redaction_system.orchestrator import Orchestrator, BatchExecutor, RunManifest, JobJournal
+    from redaction_system.cli.preview import show_preview
+    
     output_dir = Path(output) if output else Path(dirpath)
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    def output_for(filepath):
+        return output_dir / f"{Path(filepath).stem}_redacted{Path(filepath).suffix}"
+    
+    column_settings = dict(column_skip_threshold=column_threshold, always_analyze_columns=always_analyze)
     success = 0
+    skipped = 0
     errors = []
+    reports = []  # per-file audit entries for REPORT_NAME
+    pending = list(files['files'])
+    
+    # Interactive mode previews every file; hybrid previews until the first success
+    if mode != 'batch':
+        orchestrator = Orchestrator(nlp_profile=profile, **column_settings)
+        try:
+            while pending and not (mode == 'hybrid' and success > 0):
+                filepath = pending.pop(0)
+                try:
+                    approved, session = show_preview(str(filepath), prompt, orchestrator)
+                    if approved:
+                        result = orchestrator.redact_file(str(filepath), prompt, str(output_for(filepath)), session=session)
+                        reports.append({'path': str(filepath), 'output_path': result, 'report': orchestrator.last_report or None})
+                        success += 1
+                except Exception as e:
+                    errors.append((filepath, str(e)))
+        finally:
+            orchestrator.close()
     
-    for filepath in track(files['files'], description="Processing..."):
+    # Remaining files run unattended, `workers` at a time
+    if pending:
+        executor = BatchExecutor(workers=workers or 1, nlp_profile=profile, **column_settings)
         try:
-            # For batch mode, skip preview
-            if mode == 'batch' or (mode == 'hybrid' and success > 0):
-                output_path = output_dir / f"{Path(filepath).stem}_redacted{Path(filepath).suffix}"
-                orchestrator.redact_file(str(filepath), prompt, str(output_path))
+            executor.prepare(prompt)
+        except Exception as e:
+            format_error(e)
+            raise click.Abort()
+        journal = JobJournal(output_dir, resume=resume)
+        with Progress(*Progress.get_default_columns(), MofNCompleteColumn(), console=console) as progress:
+            task = progress.add_task("Processing...", total=len(pending))
+            outcomes = executor.run(
+                [(str(f), str(output_for(f))) for f in pending], prompt,
+                on_complete=lambda outcome: progress.advance(task),
+                manifest=None if force else RunManifest(output_dir),
+                journal=journal
+            )
+        journal.close()
+        executor.close()
+        for outcome in outcomes:
+            reports.append(asdict(outcome))
+            if outcome.skipped:
+                skipped += 1
+            elif outcome.ok:
                 success += 1
             else:
-                # Interactive mode - show preview for each
-                approved = show_preview(str(filepath), prompt, orchestrator)
-                if approved:
-                    output_path = output_dir / f"{Path(filepath).stem}_redacted{Path(filepath).suffix}"
-                    orchestrator.redact_file(str(filepath), prompt, str(output_path))
-                    success += 1
-        except Exception as e:
-            errors.append((filepath, str(e)))
+                errors.append((outcome.path, outcome.error))
+    
+    with open(output_dir / REPORT_NAME, 'w', encoding='utf-8') as f:
+        json.dump({'prompt': prompt, 'files': reports}, f, indent=2)
     
     # Summary
     console.print(f"\n[bold green]✅ Complete![/bold green]")
     console.print(f"[green]✓[/green] {success} files redacted successfully")
+    if skipped:
+        console.print(f"[green]✓[/green] {skipped} unchanged files skipped")
     if errors:
         console.print(f"[red]✗[/red] {len(errors)} files failed")
         for filepath, error in errors:
             console.print(f"  • {Path(filepath).name}: {error}")
+    console.print(f"📝 Report: [cyan]{output_dir / REPORT_NAME}[/cyan]")
 
 if __name__ == '__main__':
     main()
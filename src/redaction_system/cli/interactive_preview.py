@@ -162,32 +162,31 @@ def show_interactive_preview(filepath, prompt, orchestrator):
     Show interactive TUI preview
     
     Returns:
-        bool: True if approved, False if cancelled
+        tuple: (approved, session) - approved is True if approved, False if
+        cancelled; session is the AnalysisSession to pass to redact_file
+        (None if the analysis failed, or for spreadsheets, which are not
+        previewed)
     """
     from rich.console import Console
     console = Console()
     
+    if orchestrator.redacts_cells(filepath):
+        # Cells are analyzed one distinct value at a time while redacting;
+        # row-text spans would not be what gets redacted
+        console.print("[yellow]ℹ️  Spreadsheets are redacted cell by cell - no entity preview is available[/yellow]")
+        from rich.prompt import Confirm
+        return Confirm.ask("Redact without a preview?"), None
+    
     try:
-        # Get parser and extract chunks
-        parser = orchestrator._get_parser(filepath)
-        chunks = parser.parse(filepath)
-        
-        # Get entity config
-        from redaction_system.agent import interpret_prompt
-        config = interpret_prompt(prompt)
-        
-        # Analyze all chunks and collect entities
+        # Parse, interpret and analyze once - redact_file reuses the session
         console.print("[cyan]🔍 Analyzing document...[/cyan]")
+        session = orchestrator.analyze_file(filepath, prompt)
+        chunks = session.chunks
+        
+        # Collect entities per chunk
         entities_by_chunk = {}
         
-        for i, chunk in enumerate(chunks):
-            text = chunk['text']
-            results = orchestrator.redactor.analyzer.analyze(
-                text=text,
-                entities=config.entities,
-                language='en'
-            )
-            
+        for i, results in enumerate(session.results):
             # Store entities with their positions
             entities_by_chunk[i] = []
             for result in results:
@@ -203,7 +202,7 @@ def show_interactive_preview(filepath, prompt, orchestrator):
         if total_entities == 0:
             console.print("[yellow]⚠️  No entities detected[/yellow]")
             from rich.prompt import Confirm
-            return Confirm.ask("Proceed anyway?")
+            return Confirm.ask("Proceed anyway?"), session
         
         console.print(f"[green]✓[/green] Found {total_entities} entities across {len(chunks)} pages")
         console.print("[dim]Launching interactive preview...[/dim]\n")
@@ -212,10 +211,10 @@ def show_interactive_preview(filepath, prompt, orchestrator):
         app = DocumentPreview(chunks, entities_by_chunk)
         app.run()
         
-        return app.approved
+        return app.approved, session
         
     except Exception as e:
         console.print(f"[red]❌ Preview failed: {e}[/red]")
         import traceback
         traceback.print_exc()
-        return False
+        return False, None
@@ -1,5 +1,9 @@
 """Orchestrator Module"""
 from .orchestrator import Orchestrator
+from .session import AnalysisSession
+from .batch import BatchExecutor, FileOutcome
+from .manifest import RunManifest
+from .journal import JobJournal, ChunkLog
 
-__all__ = ['Orchestrator']
+__all__ = ['Orchestrator', 'AnalysisSession', 'BatchExecutor', 'FileOutcome', 'RunManifest', 'JobJournal', 'ChunkLog']
 __version__ = '0.1.0'
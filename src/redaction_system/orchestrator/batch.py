@@ -0,0 +1,271 @@
+"""Directory Batch Executor - redact many files across warm worker processes"""
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from redaction_system.agent import interpret_prompt
+from redaction_system.orchestrator.orchestrator import Orchestrator
+from redaction_system.orchestrator.manifest import RunManifest, pipeline_settings, file_snapshot
+from redaction_system.orchestrator.journal import JobJournal, ChunkLog
+from redaction_system.parsers.ocr import ocr_settings, ocr_workers
+
+# The Orchestrator used inside each worker process
+_worker_orchestrator = None
+
+# Finished files between manifest writes
+MANIFEST_SAVE_EVERY = 25
+
+
+@dataclass
+class FileOutcome:
+    """Result of redacting one file"""
+    path: str
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    skipped: bool = False  # unchanged since the last run (see RunManifest)
+    report: Optional[Dict] = None  # Orchestrator.last_report, e.g. column skip decisions (from the earlier run if skipped)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _can_fork() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _quiet():
+    # Pipeline logging from N processes would interleave; the parent shows progress
+    sys.stdout = open(os.devnull, 'w')
+
+
+def _init_forked_worker():
+    _quiet()
+
+
+def _init_spawned_worker(orchestrator_options: dict, redaction_prompt: str):
+    global _worker_orchestrator
+    _quiet()
+    _worker_orchestrator = Orchestrator(**orchestrator_options)
+    _worker_orchestrator.warm_up(redaction_prompt)
+
+
+def _ping():
+    return os.getpid()
+
+
+def _redact_one(orchestrator: Orchestrator, file_path: str, redaction_prompt: str, output_path: str,
+                chunk_log: Optional[str] = None) -> FileOutcome:
+    start = time.perf_counter()
+    checkpoint = ChunkLog(chunk_log) if chunk_log else None
+    try:
+        result = orchestrator.redact_file(file_path, redaction_prompt, output_path, checkpoint=checkpoint)
+        return FileOutcome(file_path, output_path=result, seconds=time.perf_counter() - start,
+                           report=orchestrator.last_report or None)
+    except Exception as e:
+        return FileOutcome(file_path, error=str(e) or type(e).__name__, seconds=time.perf_counter() - start)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+
+def _redact_in_worker(file_path: str, redaction_prompt: str, output_path: str,
+                      chunk_log: Optional[str] = None) -> FileOutcome:
+    return _redact_one(_worker_orchestrator, file_path, redaction_prompt, output_path, chunk_log)
+
+
+def largest_first(jobs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Order (input, output) jobs by input size, biggest first, so stragglers start early"""
+    def size(job):
+        try:
+            return os.path.getsize(job[0])
+        except OSError:
+            return 0
+    return sorted(jobs, key=size, reverse=True)
+
+
+class BatchExecutor:
+    """
+    Redacts a list of files on `workers` processes.
+
+    The parent builds one Orchestrator, interprets the prompt and loads the
+    models the job needs (`Orchestrator.warm_up`), then forks the pool so
+    every worker starts with them in shared memory. Without fork, each
+    worker builds and warms its own Orchestrator once. Files are queued
+    largest-first; a failing file is reported in its FileOutcome and never
+    stops the batch. With workers=1 everything runs in-process.
+
+    Given a RunManifest, files whose content and pipeline settings match
+    the previous run are skipped, and successful files are recorded.
+    Given a JobJournal, every finished file is journaled durably and each
+    file checkpoints its chunks, so an interrupted run can be resumed.
+    """
+
+    def __init__(self, workers: int = 1, **orchestrator_options):
+        """
+        Args:
+            workers: Number of files processed in parallel
+            orchestrator_options: Passed to Orchestrator (nlp_profile, ...).
+                Each worker analyzes its file's chunks serially and, unless
+                ocr_workers is given, OCRs with its share of the CPUs.
+        """
+        self.workers = max(1, workers)
+        self.orchestrator_options = dict(orchestrator_options, workers=1)
+        if self.orchestrator_options.get('ocr_workers') is None:
+            self.orchestrator_options['ocr_workers'] = ocr_workers(self.workers)
+        self._orchestrator = None
+        self._pool = None
+        self._prompt = None
+        self.config = None
+        self.settings = None
+
+    def prepare(self, redaction_prompt: str):
+        """Warm up and start the workers (call before starting a progress display)"""
+        global _worker_orchestrator
+        if self._prompt == redaction_prompt and (self._pool is not None or self.workers == 1):
+            return
+        self.close()
+        self._prompt = redaction_prompt
+
+        # Models load lazily, so this is cheap unless warmed up below
+        if self._orchestrator is None:
+            self._orchestrator = Orchestrator(**self.orchestrator_options)
+        if self.workers == 1 or _can_fork():
+            self.config = self._orchestrator.warm_up(redaction_prompt)
+        else:
+            self.config = interpret_prompt(redaction_prompt, client=self._orchestrator.llm)
+        self.settings = pipeline_settings(self._orchestrator.redactor, self._orchestrator.llm.model, self.config.entities,
+                                          column_skip=self._orchestrator.column_skip_settings(),
+                                          pack_chars=self._orchestrator.pack_chars, ocr=ocr_settings())
+        if self.workers == 1:
+            return
+
+        if _can_fork():
+            _worker_orchestrator = self._orchestrator
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_forked_worker
+            )
+        else:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_spawned_worker,
+                initargs=(self.orchestrator_options, redaction_prompt)
+            )
+        # Start every worker now rather than on the first real submit
+        for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+
+    def run(self, jobs: List[Tuple[str, str]], redaction_prompt: str,
+            on_complete: Callable[[FileOutcome], None] = None,
+            manifest: RunManifest = None, journal: JobJournal = None) -> List[FileOutcome]:
+        """
+        Redact [(input_path, output_path), ...].
+
+        Args:
+            on_complete: Called in the parent as each file finishes (any order)
+            manifest: Skip unchanged files and record finished ones; saved
+                every MANIFEST_SAVE_EVERY files and at the end
+            journal: Skip files finished earlier in this run, resume
+                interrupted ones from their chunk log, journal the rest
+
+        Returns: One FileOutcome per job, in completion order
+        """
+        self.prepare(redaction_prompt)
+        outcomes = []
+        snapshots = {}
+        unsaved = 0
+
+        def finish(outcome):
+            nonlocal unsaved
+            outcomes.append(outcome)
+            if journal is not None and not outcome.skipped and outcome.path in snapshots:
+                if outcome.ok:
+                    journal.record_done(outcome.path, snapshots[outcome.path], self.settings, outcome.output_path,
+                                        outcome.report)
+                else:
+                    journal.record_failed(outcome.path, outcome.error)
+            if manifest is not None and outcome.ok and not outcome.skipped:
+                manifest.record(outcome.path, snapshots[outcome.path], self.settings, outcome.output_path,
+                                outcome.report)
+                unsaved += 1
+                if unsaved >= MANIFEST_SAVE_EVERY:
+                    manifest.save()
+                    unsaved = 0
+            if on_complete:
+                on_complete(outcome)
+
+        if manifest is not None or journal is not None:
+            jobs = self._skip_finished(jobs, manifest, journal, snapshots, finish)
+        jobs = [
+            (str(file_path), str(output_path),
+             str(journal.chunk_log_path(file_path, snapshots[str(file_path)], self.settings)) if journal is not None else None)
+            for file_path, output_path in largest_first(jobs)
+        ]
+
+        try:
+            if self._pool is None:
+                for file_path, output_path, chunk_log in jobs:
+                    finish(_redact_one(self._orchestrator, file_path, redaction_prompt, output_path, chunk_log))
+                return outcomes
+
+            futures = {
+                self._pool.submit(_redact_in_worker, file_path, redaction_prompt, output_path, chunk_log): file_path
+                for file_path, output_path, chunk_log in jobs
+            }
+            broken = False
+            for future in as_completed(futures):
+                try:
+                    finish(future.result())
+                except BrokenProcessPool:
+                    broken = True
+                    finish(FileOutcome(futures[future], error="worker process died"))
+            if broken:
+                self.close()
+            return outcomes
+        finally:
+            # Also on Ctrl-C: keep whatever finished
+            if manifest is not None:
+                manifest.save()
+
+    def _skip_finished(self, jobs, manifest: Optional[RunManifest], journal: Optional[JobJournal],
+                       snapshots: dict, finish) -> List[Tuple[str, str]]:
+        """Jobs that need redacting; unchanged or already finished ones are finished as skipped"""
+        todo = []
+        for file_path, output_path in jobs:
+            file_path = str(file_path)
+            try:
+                if manifest is not None:
+                    snapshots[file_path] = manifest.snapshot(file_path)
+                else:
+                    snapshots[file_path] = file_snapshot(file_path)
+            except OSError as e:
+                finish(FileOutcome(file_path, error=str(e)))
+                continue
+            snapshot = snapshots[file_path]
+            current = manifest is not None and manifest.is_current(file_path, snapshot, self.settings)
+            report = manifest.report(file_path) if current else None
+            if not current and journal is not None and journal.is_done(file_path, snapshot, self.settings):
+                current = True
+                report = journal.report(file_path)
+                if manifest is not None:
+                    # Finished before the interruption but after the last manifest save
+                    manifest.record(file_path, snapshot, self.settings, output_path, report)
+            if current:
+                # The earlier run's report (e.g. column skip decisions) still describes the output
+                finish(FileOutcome(file_path, output_path=str(output_path), skipped=True, report=report))
+            else:
+                todo.append((file_path, output_path))
+        return todo
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._prompt = None
@@ -0,0 +1,219 @@
+"""Job Journal - durable progress of directory runs for checkpoint/resume"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+JOURNAL_DIR = ".redaction_journal"
+
+
+@contextmanager
+def atomic_output(output_path: Path):
+    """
+    Yield a temporary path next to `output_path` and rename it into place
+    only if the block succeeds - readers never see a half-written file.
+    """
+    output_path = Path(output_path)
+    tmp = output_path.with_name(f".{output_path.stem}.partial{output_path.suffix}")
+    try:
+        yield tmp
+        if tmp.exists():
+            os.replace(tmp, output_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _read_jsonl(path: Path):
+    """Records of a JSONL file, ignoring a torn last line from a crash"""
+    if not path.exists():
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _open_for_append(path: Path):
+    """Open a JSONL file for appending, terminating a torn last line first"""
+    torn = False
+    if path.exists() and path.stat().st_size:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b'\n'
+    f = open(path, 'a', encoding='utf-8')
+    if torn:
+        f.write('\n')
+    return f
+
+
+class ChunkLog:
+    """
+    Output of one in-progress file, appended as each chunk completes: the
+    redacted text, or the final spans for writers that redact the source
+    in place. Resuming the file skips every chunk found here.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+
+    def replay(self) -> "ChunkReplay":
+        """
+        The chunks logged so far, for a run that writes chunks in index order
+        (streaming redaction): looked up one by one while the log is read
+        once, instead of loading every redacted text up front.
+        """
+        return ChunkReplay(self._records_so_far())
+
+    def _records_so_far(self) -> Iterator[Dict]:
+        if not self.path.exists():
+            return
+        # Lines the resumed run appends after this point are not read back
+        remaining = self.path.stat().st_size
+        with open(self.path, 'rb') as f:
+            for line in f:
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn line from a crash
+
+    def append(self, index: int, text: Optional[str], results=None):
+        """
+        Args:
+            text: Redacted chunk text (None for in-place writers)
+            results: Final RecognizerResults, stored as [start, end, type, score]
+        """
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = _open_for_append(self.path)
+        record = {'chunk': index, 'text': text}
+        if results is not None:
+            record['spans'] = [[r.start, r.end, r.entity_type, r.score] for r in results]
+        self._file.write(json.dumps(record) + '\n')
+
+    def sync(self):
+        """Make appended chunks durable (called once per checkpoint window)"""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def discard(self):
+        """The file is finished - its chunks are no longer needed"""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ChunkReplay:
+    """Logged chunk records handed out by increasing chunk index"""
+
+    def __init__(self, records: Iterator[Dict]):
+        self._records = records
+        self._next = next(self._records, None)
+        self.restored = 0
+
+    def pop(self, index: int) -> Optional[Dict]:
+        """The record of chunk `index`, or None if it was not logged"""
+        while self._next is not None and self._next['chunk'] < index:
+            self._next = next(self._records, None)
+        if self._next is None or self._next['chunk'] != index:
+            return None
+        record, self._next = self._next, next(self._records, None)
+        self.restored += 1
+        return record
+
+    def close(self):
+        self._records.close()
+
+
+class JobJournal:
+    """
+    Append-only record of a directory run, kept in the output directory.
+
+    `journal.jsonl` logs each finished or failed file (fsync'd per record);
+    `chunks/` holds a ChunkLog per file that is in progress. A new run
+    starts from an empty journal; with `resume=True` files already done
+    (same content and settings, output present) are skipped and interrupted files
+    continue from their last completed chunk.
+    """
+
+    def __init__(self, output_dir: str, resume: bool = False):
+        self.root = Path(output_dir) / JOURNAL_DIR
+        self.path = self.root / "journal.jsonl"
+        self.chunk_dir = self.root / "chunks"
+        if not resume and self.root.exists():
+            shutil.rmtree(self.root)
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._done: Dict[str, Dict] = {}
+        for record in _read_jsonl(self.path):
+            if record.get('event') == 'done':
+                self._done[record['file']] = record
+            else:
+                self._done.pop(record.get('file'), None)
+        self._file = _open_for_append(self.path)
+
+    @staticmethod
+    def _key(input_path: str) -> str:
+        return str(Path(input_path).resolve())
+
+    @staticmethod
+    def _settings_key(settings: Dict) -> str:
+        raw = json.dumps(settings, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+    def _append(self, record: Dict):
+        record['time'] = time.time()
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def is_done(self, input_path: str, snapshot: Dict, settings: Dict) -> bool:
+        """Finished earlier with the same content and pipeline settings, output still present"""
+        record = self._done.get(self._key(input_path))
+        return (
+            record is not None
+            and record.get('sha256') == snapshot['sha256']
+            and record.get('settings') == self._settings_key(settings)
+            and Path(record.get('output_path', '')).exists()
+        )
+
+    def chunk_log_path(self, input_path: str, snapshot: Dict, settings: Dict) -> Path:
+        """Per-file chunk spool; keyed by content and settings so an edited file or a new prompt starts over"""
+        raw = f"{self._key(input_path)}\x1f{snapshot['sha256']}\x1f{self._settings_key(settings)}"
+        return self.chunk_dir / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:24]}.jsonl"
+
+    def report(self, input_path: str) -> Optional[Dict]:
+        """Report of the file's finished redaction in this run, if any"""
+        return self._done.get(self._key(input_path), {}).get('report')
+
+    def record_done(self, input_path: str, snapshot: Dict, settings: Dict, output_path: str, report: Dict = None):
+        record = {'event': 'done', 'file': self._key(input_path), 'sha256': snapshot['sha256'],
+                  'settings': self._settings_key(settings), 'output_path': str(output_path), 'report': report}
+        self._append(record)
+        self._done[record['file']] = record
+        ChunkLog(self.chunk_log_path(input_path, snapshot, settings)).discard()
+
+    def record_failed(self, input_path: str, error: Optional[str]):
+        self._append({'event': 'failed', 'file': self._key(input_path), 'error': error})
+        self._done.pop(self._key(input_path), None)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,148 @@
+"""Run Manifest - content hashes of redacted files for incremental directory runs"""
+import hashlib
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional
+from presidio_analyzer import PatternRecognizer
+
+MANIFEST_NAME = ".redaction_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    """sha256 of a file's content, read in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_snapshot(path: str, previous: Dict = None) -> Dict:
+    """
+    {'sha256', 'size', 'mtime_ns'} of a file. `previous` (an earlier
+    snapshot) supplies the hash when size and mtime are unchanged.
+    """
+    stat = os.stat(path)
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime_ns') == stat.st_mtime_ns:
+        sha256 = previous['sha256']
+    else:
+        sha256 = file_digest(path)
+    return {'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _recognizer_fingerprint(recognizers) -> str:
+    described = []
+    for recognizer in recognizers:
+        entry = {
+            'class': type(recognizer).__name__,
+            'name': recognizer.name,
+            'entities': recognizer.supported_entities,
+            'context': getattr(recognizer, 'context', None),
+        }
+        if isinstance(recognizer, PatternRecognizer):
+            entry['patterns'] = [(p.name, p.regex, p.score) for p in recognizer.patterns]
+            entry['deny_list'] = recognizer.deny_list
+        described.append(entry)
+    described.sort(key=lambda e: (e['class'], e['name']))
+    raw = json.dumps(described, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def pipeline_settings(redactor, llm_model: Optional[str], entities: List[str],
+                      column_skip: Optional[Dict] = None, pack_chars: Optional[int] = None,
+                      ocr: Optional[Dict] = None) -> Dict:
+    """
+    Everything besides the file content that determines a redacted output:
+    entity set, recognizer definitions, spaCy model (only when the job uses
+    NLP), library/LLM versions, chunk packing size, OCR availability and
+    version (see parsers.ocr.ocr_settings) and spreadsheet column skipping,
+    if enabled.
+    """
+    recognizers = redactor.registry.get_recognizers(language=redactor.language, entities=list(entities))
+    needs_nlp = redactor.pattern_engine_for(entities) is None
+    settings = {
+        'entities': sorted(entities),
+        'recognizers': _recognizer_fingerprint(recognizers),
+        'nlp_model': redactor.profile.model if needs_nlp else None,
+        'nlp_model_version': _package_version(redactor.profile.model) if needs_nlp else None,
+        'nlp_pipeline_disabled': sorted(redactor.profile.disable) if needs_nlp else None,
+        'llm_model': llm_model,
+        'presidio_analyzer': _package_version('presidio-analyzer'),
+        'redaction_system': _package_version('redaction_system'),
+        'pack_chars': pack_chars,
+        'ocr': ocr,
+    }
+    # Only present when enabled, so earlier manifests stay valid
+    if column_skip is not None:
+        settings['column_skip'] = column_skip
+    return settings
+
+
+class RunManifest:
+    """
+    Per-output-directory record of what was redacted and how.
+
+    For each input file: content hash (plus size/mtime to avoid re-hashing
+    untouched files), the pipeline settings and the output path. A file is
+    up to date when its content and settings are unchanged and its output
+    still exists, so a re-run only processes new or modified files.
+    """
+
+    def __init__(self, output_dir: str):
+        self.path = Path(output_dir) / MANIFEST_NAME
+        self.files: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == MANIFEST_VERSION:
+                    self.files = data.get('files', {})
+            except (OSError, ValueError):
+                self.files = {}  # unreadable manifest = full run
+
+    @staticmethod
+    def _key(input_path: str) -> str:
+        return str(Path(input_path).resolve())
+
+    def snapshot(self, input_path: str) -> Dict:
+        """
+        Content hash, size and mtime of an input file. The recorded hash is
+        reused when size and mtime are unchanged, so untouched files are
+        never re-read.
+        """
+        return file_snapshot(input_path, self.files.get(self._key(input_path)))
+
+    def is_current(self, input_path: str, snapshot: Dict, settings: Dict) -> bool:
+        """True if this content was already redacted with these settings and the output exists"""
+        entry = self.files.get(self._key(input_path))
+        return (
+            entry is not None
+            and entry.get('sha256') == snapshot['sha256']
+            and entry.get('settings') == settings
+            and Path(entry.get('output_path', '')).exists()
+        )
+
+    def record(self, input_path: str, snapshot: Dict, settings: Dict, output_path: str, report: Dict = None):
+        """Remember a successful redaction (snapshot taken before it started) and its report"""
+        self.files[self._key(input_path)] = dict(snapshot, settings=settings, output_path=str(output_path),
+                                                 report=report)
+
+    def report(self, input_path: str) -> Optional[Dict]:
+        """The recorded redaction's report (Orchestrator.last_report), if any"""
+        return self.files.get(self._key(input_path), {}).get('report')
+
+    def save(self):
+        """Write atomically (temp file + rename)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        tmp.write_text(json.dumps({'version': MANIFEST_VERSION, 'files': self.files}, indent=1), encoding='utf-8')
+        os.replace(tmp, self.path)
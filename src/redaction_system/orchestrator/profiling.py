@@ -0,0 +1,62 @@
+"""Column Profiling - estimate per-column PII hit rates from a row sample"""
+import random
+from dataclasses import dataclass, field
+from typing import Collection, Dict, List, Set
+from redaction_system.parsers.excel_parser import cell_text
+
+# Rows sampled (from the first block of a spreadsheet) to profile columns
+PROFILE_SAMPLE_ROWS = 200
+
+
+@dataclass
+class ColumnProfile:
+    """Sampled PII hit rate of one spreadsheet column and the decision taken"""
+    index: int
+    name: str
+    sampled: int  # non-empty cells analyzed
+    hits: int  # cells with at least one candidate
+    skipped: bool = False
+    forced: bool = False  # in the always-analyze list
+    # Sampled values with candidates; still redacted when the column is skipped
+    hit_values: Set = field(default_factory=set, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.sampled if self.sampled else 0.0
+
+    def to_dict(self) -> Dict:
+        # hit_values are cell contents (PII) and stay out of reports
+        return {'index': self.index, 'name': self.name, 'sampled': self.sampled, 'hits': self.hits,
+                'skipped': self.skipped, 'forced': self.forced, 'hit_rate': round(self.hit_rate, 4)}
+
+
+def profile_columns(redactor, header: List[str], frame, entities: List[str], threshold: float,
+                    always_analyze: Collection[str] = (), sample_rows: int = PROFILE_SAMPLE_ROWS,
+                    seed: int = 0) -> List[ColumnProfile]:
+    """
+    Analyze a random sample of `frame`'s rows and decide which columns the
+    full pass can skip: those whose hit rate is below `threshold`, unless
+    their header name is in `always_analyze`. A skipped column's
+    `hit_values` (the sampled values that did have candidates) are still
+    analyzed and redacted wherever they occur.
+
+    Args:
+        redactor: Anything with `analyze_batch` (PresidioRedactor, ParallelRedactor)
+        header: Column names, by position
+        frame: DataFrame of cells to sample from
+        seed: Fixed so re-runs over the same file make the same decisions
+    """
+    rows = sorted(random.Random(seed).sample(range(len(frame)), min(sample_rows, len(frame))))
+    profiles = []
+    for col in range(frame.shape[1]):
+        name = (cell_text(header[col]) if col < len(header) else '') or str(col)
+        cells = [cell_text(value) for value in frame.iloc[rows, col] if cell_text(value).strip()]
+        distinct = list(dict.fromkeys(cells))
+        results = redactor.analyze_batch(distinct, entities, score_threshold=0.1)
+        flagged = {value for value, value_results in zip(distinct, results) if value_results}
+        profile = ColumnProfile(col, name, len(cells), sum(value in flagged for value in cells), hit_values=flagged)
+        profile.forced = name in always_analyze
+        # A column with nothing to sample is kept - later rows may fill it
+        profile.skipped = not profile.forced and profile.sampled > 0 and profile.hit_rate < threshold
+        profiles.append(profile)
+    return profiles
@@ -0,0 +1,33 @@
+"""Analysis Session - Parsed chunks + Presidio candidates shared between preview and redaction"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict
+from presidio_analyzer import RecognizerResult
+from redaction_system.agent import EntityConfig
+
+
+@dataclass
+class AnalysisSession:
+    """
+    Result of the parse -> interpret -> analyze steps for one file.
+
+    Produced by `Orchestrator.analyze_file` (and the interactive preview),
+    consumed by `Orchestrator.redact_file` so approving a preview only runs
+    validation, anonymization and writing.
+    """
+    file_path: str
+    prompt: str
+    chunks: List[Dict]
+    config: EntityConfig
+    results: List[List[RecognizerResult]] = field(default_factory=list)
+
+    def matches(self, file_path: str, prompt: str) -> bool:
+        """True if this session was built for the same file and prompt"""
+        return (
+            Path(self.file_path).resolve() == Path(file_path).resolve()
+            and self.prompt == prompt
+        )
+
+    @property
+    def total_candidates(self) -> int:
+        return sum(len(r) for r in self.results)
@@ -0,0 +1,355 @@
+"""Chunk Writers - append redacted chunks to the output as soon as they are final"""
+import csv
+import shutil
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+from typing import Dict, List, Optional, Sequence, Tuple
+from presidio_analyzer import RecognizerResult
+
+# Character box as (x0, top, x1, bottom) in pdfplumber page coordinates
+Box = Tuple[float, float, float, float]
+
+# Bytes copied between zip entries at a time
+READ_BLOCK = 64 * 1024
+
+
+class TextChunkWriter:
+    """Text/Markdown output: each chunk followed by its separator"""
+
+    # Writers that rebuild the file from anonymized text; see PDFChunkWriter
+    needs_text = True
+
+    def __init__(self, output_path: Path, source_path: Path = None):
+        self._file = open(output_path, 'w', encoding='utf-8')
+
+    def write(self, chunk: Dict, text: str, results: Sequence[RecognizerResult] = ()):
+        self._file.write(text + chunk.get('separator', '\n\n'))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def _placeholder(result: RecognizerResult) -> str:
+    # Same text as presidio's default "replace" operator used by PresidioRedactor.anonymize
+    return f"<{result.entity_type}>"
+
+
+def segment_edits(segments: Sequence[tuple], results: Sequence[RecognizerResult]) -> List[tuple]:
+    """
+    New texts for the run texts of one paragraph (see DOCXParser.iter_chunks)
+    so each result span reads as its placeholder: the placeholder goes
+    where the span's first character was, the rest of the span is removed
+    from whichever runs it crosses, and run formatting stays as it was.
+    Tabs and breaks inside a span are kept.
+
+    Returns [(start offset, end tag offset, tag name, new text), ...] for
+    the changed runs only.
+    """
+    # Overlapping spans are merged, keeping the higher-scoring entity type
+    spans = []
+    for r in sorted(results, key=lambda r: (r.start, -r.score)):
+        if spans and r.start < spans[-1][1]:
+            last = spans[-1]
+            spans[-1] = (last[0], max(last[1], r.end), last[2] if last[2].score >= r.score else r)
+        else:
+            spans.append((r.start, r.end, r))
+
+    edits = []
+    placed = set()  # spans whose placeholder is written
+    pos = 0
+    span_index = 0
+    for start, end_tag, tag, text in segments:
+        if start is None or not any(s < pos + len(text) and e > pos for s, e, _ in spans):
+            pos += len(text)
+            continue
+        pieces = []
+        for offset, char in enumerate(text, pos):
+            while span_index < len(spans) and spans[span_index][1] <= offset:
+                span_index += 1
+            if span_index < len(spans) and spans[span_index][0] <= offset:
+                if span_index not in placed:
+                    placed.add(span_index)
+                    pieces.append(_placeholder(spans[span_index][2]))
+                continue
+            pieces.append(char)
+        edits.append((start, end_tag, tag, ''.join(pieces)))
+        pos += len(text)
+    return edits
+
+
+class _PartRewriter:
+    """Copy one package part from the source zip to the output, replacing byte ranges in order"""
+
+    def __init__(self, source: zipfile.ZipFile, info: zipfile.ZipInfo, out: zipfile.ZipFile):
+        self.name = info.filename
+        self._reader = source.open(info)
+        # zipfile sizes zip64 from the source part's size (see _copy_info);
+        # placeholders can make the part longer, so leave room for that too
+        self._writer = out.open(_copy_info(info), 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT // 2)
+        self._pos = 0
+
+    def _copy(self, size: int, keep: bool):
+        while size > 0:
+            block = self._reader.read(min(size, READ_BLOCK))
+            if not block:
+                break
+            if keep:
+                self._writer.write(block)
+            size -= len(block)
+            self._pos += len(block)
+
+    def replace_element(self, start: int, end_tag: int, data: bytes):
+        """Write `data` instead of the element from `start` to the '>' closing its end tag at `end_tag`"""
+        self._copy(start - self._pos, keep=True)
+        self._copy(end_tag - self._pos, keep=False)
+        while True:
+            char = self._reader.read(1)
+            self._pos += len(char)
+            if char in (b'>', b''):
+                break
+        self._writer.write(data)
+
+    def finish(self):
+        shutil.copyfileobj(self._reader, self._writer, READ_BLOCK)
+        self._reader.close()
+        self._writer.close()
+
+
+def _copy_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    copy = zipfile.ZipInfo(info.filename, info.date_time)
+    copy.compress_type = zipfile.ZIP_DEFLATED
+    copy.external_attr = info.external_attr
+    # Expected size: zipfile writes zip64 headers only for entries near the 4 GiB limit
+    copy.file_size = info.file_size
+    return copy
+
+
+class DOCXChunkWriter:
+    """
+    DOCX output redacted in place: the package is copied part by part, and
+    only the run texts (<w:t>, <w:delText>, <w:instrText>) touched by a
+    final span are rewritten (see segment_edits), straight from the chunks'
+    byte offsets. Formatting, tables, headers, footers and text boxes are
+    kept; nothing beyond one paragraph is ever held in memory.
+    """
+
+    # Works from spans and run offsets; the anonymized text is never used
+    needs_text = False
+
+    def __init__(self, output_path: Path, source_path: Path = None):
+        self._source = zipfile.ZipFile(source_path)
+        self._out = zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED)
+        self._entries = iter(self._source.infolist())
+        self._part = None
+        self._edits = []  # edits of the current top-level paragraph
+
+    def _open_part(self, name: str):
+        if self._part is not None:
+            self._part.finish()
+            self._part = None
+        for info in self._entries:
+            if info.filename == name:
+                self._part = _PartRewriter(self._source, info, self._out)
+                return
+            self._copy_entry(info)
+        raise ValueError(f"Part not found in DOCX: {name}")
+
+    def _copy_entry(self, info: zipfile.ZipInfo):
+        with self._source.open(info) as reader, self._out.open(_copy_info(info), 'w') as writer:
+            shutil.copyfileobj(reader, writer, READ_BLOCK)
+
+    def write(self, chunk: Dict, text: str, results: Sequence[RecognizerResult] = ()):
+        if self._part is None or self._part.name != chunk['part']:
+            self._open_part(chunk['part'])
+        self._edits.extend(segment_edits(chunk['segments'], results))
+        # Nested (text box) paragraphs interleave with their parent, so
+        # edits are applied in file order once the whole group is in
+        if chunk.get('group_last'):
+            for start, end_tag, tag, new_text in sorted(self._edits):
+                element = f'<{tag} xml:space="preserve">{escape(new_text)}</{tag}>'
+                self._part.replace_element(start, end_tag, element.encode('utf-8'))
+            self._edits = []
+
+    def flush(self):
+        # Zip entries are only complete once their part is finished
+        pass
+
+    def close(self):
+        if self._part is not None:
+            self._part.finish()
+        for info in self._entries:
+            self._copy_entry(info)
+        self._out.close()
+        self._source.close()
+
+
+def span_rects(boxes: Sequence[Optional[Box]], spans: Sequence[Tuple[int, int]]) -> List[Box]:
+    """
+    Rectangles covering the characters of each (start, end) text span, one
+    per line the span runs over. `boxes` holds one box per character of
+    the page text (None for spacing and line breaks the extractor added).
+    """
+    rects = []
+    for start, end in spans:
+        line = None
+        for box in boxes[start:end]:
+            if box is None:
+                continue
+            x0, top, x1, bottom = box
+            if line is not None and top < line[3] and bottom > line[1]:
+                line = (min(line[0], x0), min(line[1], top), max(line[2], x1), max(line[3], bottom))
+                continue
+            if line is not None:
+                rects.append(line)
+            line = box
+        if line is not None:
+            rects.append(line)
+    return rects
+
+
+def _plumber_to_page(fitz, page):
+    """
+    Matrix from pdfplumber coordinates to PyMuPDF's for `page`. pdfplumber
+    measures from the top-left of the *rotated mediabox*; PyMuPDF places
+    annotations in the *unrotated* page, measured from the cropbox's
+    top-left. Both are y-down.
+    """
+    width, height = page.mediabox.width, page.mediabox.height
+    derotate = {
+        0: fitz.Matrix(1, 0, 0, 1, 0, 0),
+        90: fitz.Matrix(0, -1, 1, 0, 0, height),
+        180: fitz.Matrix(-1, 0, 0, -1, width, height),
+        270: fitz.Matrix(0, 1, -1, 0, width, 0),
+    }[page.rotation]
+    return derotate * fitz.Matrix(1, 0, 0, 1, page.mediabox.x0 - page.cropbox.x0, -page.cropbox.y0)
+
+
+class PDFChunkWriter:
+    """
+    PDF output redacted in place with PyMuPDF: the character boxes of every
+    final span become redaction annotations on its page, and applying them
+    removes the text objects underneath and paints the boxes black. Layout,
+    images and pages without findings are left as they are; on OCRed pages
+    the image pixels under each box are blanked as well.
+
+    Chunks must carry 'page' and 'boxes' (PDFParser.iter_chunks with
+    with_boxes=True); each page is redacted as soon as its chunk arrives.
+    Boxes are mapped onto the page through its rotation and cropbox, from
+    pdfplumber's frame for text-layer pages and from the rendered (rotated,
+    cropped) page for OCRed ones.
+
+    The file itself is written once, on close. An incremental save after
+    each page would leave the original, unredacted text objects in earlier
+    revisions of the file; only a full save with garbage collection drops
+    them. Until then PyMuPDF holds just the redacted pages' new content in
+    memory - every other page is copied from the source while saving.
+    """
+
+    # Works from spans and boxes; the anonymized text is never used
+    needs_text = False
+
+    def __init__(self, output_path: Path, source_path: Path = None):
+        import fitz
+        self._fitz = fitz
+        self.output_path = output_path
+        self._doc = fitz.open(source_path)
+
+    def write(self, chunk: Dict, text: str, results: Sequence[RecognizerResult] = ()):
+        rects = span_rects(chunk.get('boxes') or [], [(r.start, r.end) for r in results])
+        if not rects:
+            return
+        page = self._doc[chunk['page'] - 1]
+        matrix = page.derotation_matrix if chunk.get('ocr') else _plumber_to_page(self._fitz, page)
+        for rect in rects:
+            page.add_redact_annot(self._fitz.Rect(*rect) * matrix, fill=(0, 0, 0))
+        # An OCRed page's text lives in its scan - blank the covered pixels too
+        images = self._fitz.PDF_REDACT_IMAGE_PIXELS if chunk.get('ocr') else self._fitz.PDF_REDACT_IMAGE_NONE
+        page.apply_redactions(images=images)
+
+    def flush(self):
+        # Pages are redacted in memory and written out together on close (see above)
+        pass
+
+    def close(self):
+        # garbage=3 drops the removed text objects instead of keeping them unreferenced
+        self._doc.save(self.output_path, garbage=3, deflate=True)
+        self._doc.close()
+
+
+CHUNK_WRITERS = {
+    '.md': TextChunkWriter,
+    '.txt': TextChunkWriter,
+    '.docx': DOCXChunkWriter,
+    '.pdf': PDFChunkWriter,
+}
+
+
+def open_chunk_writer(output_path: Path, file_format: str, source_path: Path = None) -> Optional[object]:
+    """
+    Writer for `file_format` (e.g. '.txt'), or None when the format has no
+    output support yet. `source_path` is the input file, for writers that
+    edit a copy of it (PDF).
+    """
+    writer_class = CHUNK_WRITERS.get(file_format)
+    return writer_class(output_path, source_path) if writer_class is not None else None
+
+
+class CSVTableWriter:
+    """CSV output: the header, then each block of rows as it is redacted"""
+
+    def __init__(self, output_path: Path):
+        self._file = open(output_path, 'w', encoding='utf-8', newline='')
+        # One writer for header and body, so every line ends the same way
+        self._writer = csv.writer(self._file, lineterminator='\n')
+
+    def start_sheet(self, name: Optional[str], header: List):
+        # A CSV has exactly one (unnamed) sheet
+        self._writer.writerow(header)
+
+    def write_frame(self, frame):
+        self._writer.writerows(frame.itertuples(index=False, name=None))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class XLSXTableWriter:
+    """
+    XLSX output through openpyxl's write-only (streaming) workbook: one
+    sheet per input sheet, same names, rows written from A1 in order so
+    every cell keeps its position.
+    """
+
+    def __init__(self, output_path: Path):
+        from openpyxl import Workbook
+        self.output_path = output_path
+        self._book = Workbook(write_only=True)
+        self._sheet = None
+
+    def start_sheet(self, name: Optional[str], header: List):
+        self._sheet = self._book.create_sheet(title=name)
+        self._sheet.append([value if value != '' else None for value in header])
+
+    def write_frame(self, frame):
+        for row in frame.itertuples(index=False, name=None):
+            # Empty cells stay empty instead of becoming '' strings
+            self._sheet.append([value if value != '' else None for value in row])
+
+    def close(self):
+        if self._sheet is None:
+            # A workbook needs at least one sheet
+            self._book.create_sheet()
+        self._book.save(self.output_path)
+
+
+# .xls can't be written any more - it is redacted to .xlsx
+TABLE_WRITERS = {
+    '.csv': CSVTableWriter,
+    '.xlsx': XLSXTableWriter,
+    '.xls': XLSXTableWriter,
+}
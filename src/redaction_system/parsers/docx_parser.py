@@ -1,7 +1,22 @@
 """DOCX File Parser"""
-from typing import List, Dict
+import re
+import zipfile
+from typing import Dict, Iterator, List
 from pathlib import Path
-from docx import Document
+from xml.parsers import expat
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+# Package parts holding document text: body (with tables and text boxes),
+# headers, footers, notes and comments
+TEXT_PART = re.compile(r'word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml')
+
+# Run children holding text: visible text, tracked deletions and field
+# instructions (e.g. a HYPERLINK target) - all of them stay in the file
+RUN_TEXT = ('t', 'delText', 'instrText')
+
+# Decompressed bytes fed to the XML parser at a time
+READ_BLOCK = 64 * 1024
 
 class DOCXParser:
     """Parse DOCX files and extract text"""
@@ -17,7 +32,23 @@ class DOCXParser:
             file_path: Path to DOCX file
         
         Returns:
-            List of dicts with 'text', 'paragraph', 'chunk_id'
+            List of dicts with 'text', 'part', 'paragraph', 'chunk_id'
+        """
+        chunks = list(self.iter_chunks(file_path))
+        print(f"   ✅ Extracted {len(chunks)} paragraphs from DOCX")
+        return chunks
+    
+    def iter_chunks(self, file_path: str) -> Iterator[Dict]:
+        """
+        Yield one chunk per paragraph of every text part, streaming the
+        part XML with expat (no object model is built).
+        
+        Each chunk also carries 'segments', where its text lives in the
+        part: (byte offset of the run text element - <w:t>, <w:delText> or
+        <w:instrText> - byte offset of its end tag, tag name, text) per run
+        text, (None, None, None, text) for tabs and breaks.
+        'group_last' marks the last chunk of a top-level paragraph (text box
+        paragraphs nest inside one). See DOCXChunkWriter.
         """
         file_path = Path(file_path)
         
@@ -28,25 +59,99 @@ class DOCXParser:
             raise ValueError(f"Not a DOCX file: {file_path}")
         
         print(f"🔍 Parsing DOCX: {file_path.name}")
-        
-        chunks = []
-        
+        return self._iter_chunks(file_path)
+    
+    def _iter_chunks(self, file_path: Path) -> Iterator[Dict]:
         try:
-            doc = Document(file_path)
-            
-            for para_num, paragraph in enumerate(doc.paragraphs, 1):
-                text = paragraph.text.strip()
-                
-                if text:
-                    chunks.append({
-                        'text': text,
-                        'paragraph': para_num,
-                        'chunk_id': f"docx_{para_num}",
-                        'format': 'docx'
-                    })
-            
-            print(f"   ✅ Extracted {len(chunks)} paragraphs from DOCX")
-            return chunks
-            
+            para_num = 0
+            with zipfile.ZipFile(file_path) as package:
+                for info in package.infolist():
+                    if not TEXT_PART.fullmatch(info.filename):
+                        continue
+                    with package.open(info) as part:
+                        for group in _iter_paragraph_groups(part):
+                            chunks = []
+                            for segments in group:
+                                para_num += 1
+                                text = ''.join(segment[3] for segment in segments)
+                                if text.strip():
+                                    chunks.append({
+                                        'text': text,
+                                        'part': info.filename,
+                                        'paragraph': para_num,
+                                        'chunk_id': f"docx_{para_num}",
+                                        'format': 'docx',
+                                        'segments': segments
+                                    })
+                            if chunks:
+                                chunks[-1]['group_last'] = True
+                                yield from chunks
+        
         except Exception as e:
             raise RuntimeError(f"Error parsing DOCX: {e}")
+
+
+def _iter_paragraph_groups(part) -> Iterator[List[List[tuple]]]:
+    """
+    Stream a WordprocessingML part and yield, per top-level paragraph, the
+    segment lists of it and every paragraph nested in it (innermost first).
+    """
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.namespace_prefixes = True
+    stack = []  # (namespace, local name) of open elements
+    paragraphs = []  # segment lists of open paragraphs
+    finished = []  # closed paragraphs of the current top-level one
+    groups = []  # complete groups, drained after each block
+    text_run = None  # [start offset, tag name, text pieces] of the open run text
+
+    def start(name, attrs):
+        nonlocal text_run
+        parts = name.split(' ')
+        if len(parts) == 1:
+            namespace, local, prefix = '', name, ''
+        else:
+            namespace, local, prefix = (parts + [''])[:3]
+        parent = stack[-1] if stack else None
+        stack.append((namespace, local))
+        if namespace != W_NS:
+            return
+        if local == 'p':
+            paragraphs.append([])
+        elif paragraphs and parent == (W_NS, 'r'):
+            if local in RUN_TEXT:
+                text_run = [parser.CurrentByteIndex, f"{prefix}:{local}" if prefix else local, []]
+            elif local == 'tab':
+                paragraphs[-1].append((None, None, None, '\t'))
+            elif local in ('br', 'cr'):
+                paragraphs[-1].append((None, None, None, '\n'))
+
+    def end(name):
+        nonlocal text_run
+        namespace, local = stack.pop()
+        if namespace != W_NS:
+            return
+        if local in RUN_TEXT and text_run is not None:
+            start_offset, tag, pieces = text_run
+            paragraphs[-1].append((start_offset, parser.CurrentByteIndex, tag, ''.join(pieces)))
+            text_run = None
+        elif local == 'p' and paragraphs:
+            finished.append(paragraphs.pop())
+            if not paragraphs:
+                groups.append(list(finished))
+                finished.clear()
+
+    def characters(data):
+        if text_run is not None:
+            text_run[2].append(data)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+
+    while True:
+        block = part.read(READ_BLOCK)
+        parser.Parse(block, not block)
+        yield from groups
+        groups.clear()
+        if not block:
+            break
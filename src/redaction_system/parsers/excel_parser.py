@@ -1,7 +1,11 @@
 """Excel File Parser"""
-from typing import List, Dict
+import csv
+from itertools import zip_longest
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-import pandas as pd
+
+# Rows per DataFrame when a sheet is streamed with `iter_sheets`
+TABLE_CHUNK_ROWS = 10_000
 
 class ExcelParser:
     """Parse Excel files and extract data"""
@@ -17,42 +21,166 @@ class ExcelParser:
             file_path: Path to Excel file (.xlsx or .csv)
         
         Returns:
-            List of dicts with 'text', 'row', 'chunk_id'
+            List of dicts with 'text', 'sheet', 'row', 'chunk_id'
+        """
+        chunks = list(self.iter_chunks(file_path))
+        print(f"   ✅ Extracted {len(chunks)} rows from Excel")
+        return chunks
+    
+    def iter_chunks(self, file_path: str) -> Iterator[Dict]:
+        """
+        Yield the same chunks as `parse` lazily, row by row over every
+        sheet (see `iter_sheets`).
+        """
+        sheets = self.iter_sheets(file_path)
+        return self._iter_chunks(sheets)
+    
+    def _iter_chunks(self, sheets) -> Iterator[Dict]:
+        chunk_num = 0
+        for sheet_name, header, frames in sheets:
+            row_num = 1  # the header row
+            for frame in frames:
+                for row in frame.itertuples(index=False, name=None):
+                    row_num += 1
+                    # Combine all columns into single text
+                    cells = {str(col): val for col, val in zip(header, row) if cell_text(val).strip()}
+                    if not cells:
+                        continue
+                    chunk_num += 1
+                    yield {
+                        'text': ' | '.join(f"{col}: {val}" for col, val in cells.items()),
+                        'sheet': sheet_name,
+                        'row': row_num,
+                        'chunk_id': f"excel_{chunk_num}",
+                        'format': 'excel',
+                        'original_row': cells
+                    }
+    
+    def iter_sheets(self, file_path: str, rows: int = TABLE_CHUNK_ROWS) -> Iterator[Tuple[Optional[str], List, Iterator]]:
+        """
+        Read every sheet of a spreadsheet as (sheet name, header row, frames),
+        where frames yields DataFrames of at most `rows` body rows.
+        
+        CSVs (one sheet, named None) and .xlsx workbooks are streamed, so
+        memory stays flat whatever the file size; .xls is read through
+        pandas, one sheet at a time. Columns are positional from column A and
+        duplicate header names are kept as they are. CSV cells are str ('' when
+        empty); workbook cells keep their value (str, number, date or None).
+        .xlsx formulas come out as their cached values; a formula without one
+        (e.g. in files written by openpyxl or other non-Excel tools) comes out
+        as its formula text ('=...'), which writes back as the same formula.
         """
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
-        if file_path.suffix.lower() not in ['.xlsx', '.xls', '.csv']:
+        suffix = file_path.suffix.lower()
+        if suffix not in ['.xlsx', '.xls', '.csv']:
             raise ValueError(f"Not an Excel file: {file_path}")
         
-        print(f"🔍 Parsing Excel: {file_path.name}")
-        
-        chunks = []
+        print(f"🔍 Streaming {suffix[1:].upper()}: {file_path.name} ({rows} rows at a time)")
+        if suffix == '.csv':
+            return self._iter_csv_sheet(file_path, rows)
+        if suffix == '.xlsx':
+            return self._iter_xlsx_sheets(file_path, rows)
+        return self._iter_xls_sheets(file_path, rows)
+    
+    def _iter_csv_sheet(self, file_path: Path, rows: int):
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), [])
+        yield None, header, self._iter_csv_frames(file_path, len(header), rows)
+    
+    def _iter_csv_frames(self, file_path: Path, width: int, rows: int) -> Iterator:
+        # csv rather than pandas.read_csv: pandas fixes the column count from
+        # the first row it reads and fails (or drops fields) on wider rows
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # the header
+                # Blank lines are skipped, as pandas did
+                yield from _frames((row for row in reader if row), rows, width=width, fill='', dtype=str)
         
+        except Exception as e:
+            raise RuntimeError(f"Error parsing CSV: {e}")
+    
+    def _iter_xlsx_sheets(self, file_path: Path, rows: int):
         try:
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path, dtype=str)
-            else:
-                df = pd.read_excel(file_path, dtype=str)
-            
-            # Convert each row to text
-            for row_num, (idx, row) in enumerate(df.iterrows(), 1):
-                # Combine all columns into single text
-                row_text = ' | '.join([f"{col}: {val}" for col, val in row.items() if pd.notna(val)])
-                
-                if row_text.strip():
-                    chunks.append({
-                        'text': row_text,
-                        'row': row_num,
-                        'chunk_id': f"excel_{row_num}",
-                        'format': 'excel',
-                        'original_row': row.to_dict()
-                    })
-            
-            print(f"   ✅ Extracted {len(chunks)} rows from Excel")
-            return chunks
+            from openpyxl import load_workbook
+            # read_only parses rows lazily from the zip instead of building the workbook
+            book = load_workbook(file_path, read_only=True, data_only=True)
+            # Same cells with formula text, for formulas that have no cached value
+            formula_book = load_workbook(file_path, read_only=True)
+        except Exception as e:
+            raise RuntimeError(f"Error parsing Excel: {e}")
+        try:
+            for sheet, formula_sheet in zip(book.worksheets, formula_book.worksheets):
+                # From A1 so row/column positions survive blank leading rows and columns
+                sheet_rows = _with_uncached_formulas(
+                    sheet.iter_rows(min_row=1, min_col=1, values_only=True),
+                    formula_sheet.iter_rows(min_row=1, min_col=1, values_only=True)
+                )
+                header = list(next(sheet_rows, ()))
+                yield sheet.title, header, _frames(sheet_rows, rows)
+        finally:
+            book.close()
+            formula_book.close()
+    
+    def _iter_xls_sheets(self, file_path: Path, rows: int):
+        try:
+            import pandas as pd
             
+            book = pd.ExcelFile(file_path)
+            for sheet_name in book.sheet_names:
+                sheet = book.parse(sheet_name, header=None, dtype=str, keep_default_na=False)
+                if sheet.empty:
+                    yield sheet_name, [], iter(())
+                    continue
+                body = sheet.iloc[1:].reset_index(drop=True)
+                yield sheet_name, list(sheet.iloc[0]), (body.iloc[i:i + rows] for i in range(0, len(body), rows))
+        
         except Exception as e:
             raise RuntimeError(f"Error parsing Excel: {e}")
+
+
+def cell_text(value) -> str:
+    """Text of a cell for analysis ('' for empty cells)"""
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def _is_formula(value) -> bool:
+    return isinstance(value, str) and value.startswith('=')
+
+
+def _with_uncached_formulas(value_rows, formula_rows) -> Iterator[tuple]:
+    """Cached-value rows, with the formula text wherever a formula cell has no cached value"""
+    for values, formulas in zip_longest(value_rows, formula_rows, fillvalue=()):
+        if any(value is None and _is_formula(formula) for value, formula in zip(values, formulas)):
+            values = tuple(formula if value is None and _is_formula(formula) else value
+                           for value, formula in zip_longest(values, formulas))
+        yield values
+
+
+def _frames(sheet_rows, rows: int, width: int = 0, fill=None, dtype=object) -> Iterator:
+    """
+    Group row sequences into DataFrames of `rows` rows, each padded with
+    `fill` to at least `width` columns and to its widest row
+    """
+    import pandas as pd
+
+    block = []
+    for row in sheet_rows:
+        block.append(row)
+        if len(block) == rows:
+            yield _frame(pd, block, width, fill, dtype)
+            block = []
+    if block:
+        yield _frame(pd, block, width, fill, dtype)
+
+
+def _frame(pd, block: List, width: int, fill, dtype):
+    width = max(width, max(len(row) for row in block))
+    # For workbooks, dtype=object keeps ints as ints and None as None (no float/NaN coercion)
+    return pd.DataFrame([list(row) + [fill] * (width - len(row)) for row in block], dtype=dtype)
@@ -1,6 +1,7 @@
 """Markdown File Parser"""
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from pathlib import Path
+from .paragraphs import iter_paragraphs
 
 class MarkdownParser:
     """Parse Markdown files and extract text"""
@@ -16,7 +17,16 @@ class MarkdownParser:
             file_path: Path to Markdown file
         
         Returns:
-            List of dicts with 'text', 'line', 'chunk_id'
+            List of dicts with 'text', 'line_start', 'chunk_id'
+        """
+        chunks = list(self.iter_chunks(file_path))
+        print(f"   ✅ Extracted {len(chunks)} chunks from Markdown")
+        return chunks
+    
+    def iter_chunks(self, file_path: str) -> Iterator[Dict]:
+        """
+        Yield the same chunks as `parse` lazily, reading line by line - memory
+        stays bounded whatever the file size.
         """
         file_path = Path(file_path)
         
@@ -27,47 +37,11 @@ class MarkdownParser:
             raise ValueError(f"Not a Markdown file: {file_path}")
         
         print(f"🔍 Parsing Markdown: {file_path.name}")
-        
-        chunks = []
-        
+        return self._iter_chunks(file_path)
+    
+    def _iter_chunks(self, file_path: Path) -> Iterator[Dict]:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Group lines into chunks (non-empty paragraphs)
-            current_chunk = []
-            chunk_num = 0
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.rstrip()
-                
-                if line.strip():
-                    current_chunk.append(line)
-                elif current_chunk:
-                    # Empty line = end of paragraph
-                    text = '\n'.join(current_chunk)
-                    chunk_num += 1
-                    
-                    chunks.append({
-                        'text': text,
-                        'line_start': line_num - len(current_chunk),
-                        'chunk_id': f"md_{chunk_num}",
-                        'format': 'markdown'
-                    })
-                    current_chunk = []
-            
-            # Add remaining chunk
-            if current_chunk:
-                text = '\n'.join(current_chunk)
-                chunk_num += 1
-                chunks.append({
-                    'text': text,
-                    'chunk_id': f"md_{chunk_num}",
-                    'format': 'markdown'
-                })
-            
-            print(f"   ✅ Extracted {len(chunks)} chunks from Markdown")
-            return chunks
-            
+                yield from iter_paragraphs(f, 'md', 'markdown')
         except Exception as e:
             raise RuntimeError(f"Error parsing Markdown: {e}")
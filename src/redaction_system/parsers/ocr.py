@@ -0,0 +1,134 @@
+"""OCR Fallback - text for image-only PDF pages via Tesseract, cached by page image"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from redaction_system.agent.cache import SQLiteLRUCache, default_cache_dir
+
+# Render resolution for OCR; page boxes are scaled back by 72 / OCR_DPI
+OCR_DPI = 300
+
+# Tesseract language(s), e.g. "eng+hin"
+OCR_LANG = os.getenv("REDACTION_OCR_LANG", "eng")
+
+# Per-process state of OCR workers
+_worker_cache = None
+_worker_doc = None  # (file_path, fitz.Document) of the PDF being OCRed
+
+
+class OCRCache(SQLiteLRUCache):
+    """
+    OCR results keyed by a hash of the rendered page image (plus language
+    and resolution), so re-runs, previews and identical pages in other
+    files skip Tesseract.
+    """
+
+    def __init__(self, path: Path = None, max_entries: int = None):
+        if max_entries is None:
+            max_entries = int(os.getenv("REDACTION_OCR_CACHE_SIZE", 50_000))
+        super().__init__(path or default_cache_dir() / "ocr.sqlite3", "ocr", max_entries)
+
+    @staticmethod
+    def make_key(image: bytes, lang: str, dpi: int) -> str:
+        digest = hashlib.sha256(image).hexdigest()
+        return hashlib.sha256(f"{digest}\x1f{lang}\x1f{dpi}".encode('utf-8')).hexdigest()
+
+    def get_page(self, key: str) -> Optional[Dict]:
+        value = self.get(key)
+        return None if value is None else json.loads(value)
+
+    def put_page(self, key: str, page: Dict):
+        self.put(key, json.dumps(page))
+
+
+def ocr_available() -> bool:
+    """True if PyMuPDF, pytesseract and the tesseract binary can all be used"""
+    try:
+        import fitz  # noqa: F401
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def ocr_settings() -> Dict:
+    """What OCR output depends on, for run manifests: whether it can run, Tesseract version, language, resolution"""
+    if os.getenv("REDACTION_OCR", "1") == "0" or not ocr_available():
+        return {'tesseract': None}
+    import pytesseract
+    return {'tesseract': str(pytesseract.get_tesseract_version()), 'lang': OCR_LANG, 'dpi': OCR_DPI}
+
+
+def _page_from_words(data: Dict, scale: float) -> Dict:
+    """
+    Page text from Tesseract's word table (one line per text line, words
+    separated by spaces) and one box per character in PDF points - the
+    word's box, None for the separators.
+    """
+    lines = {}
+    for i, word in enumerate(data['text']):
+        word = word.strip()
+        if not word:
+            continue
+        box = (data['left'][i] * scale, data['top'][i] * scale,
+               (data['left'][i] + data['width'][i]) * scale, (data['top'][i] + data['height'][i]) * scale)
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        lines.setdefault(key, []).append((word, box))
+
+    text_parts = []
+    boxes = []
+    for words in lines.values():
+        if text_parts:
+            text_parts.append('\n')
+            boxes.append(None)
+        for w, (word, box) in enumerate(words):
+            if w:
+                text_parts.append(' ')
+                boxes.append(None)
+            text_parts.append(word)
+            boxes.extend([box] * len(word))
+    return {'text': ''.join(text_parts), 'boxes': boxes}
+
+
+def ocr_page(file_path: str, page_index: int, lang: str = OCR_LANG, dpi: int = OCR_DPI) -> Tuple[Dict, bool]:
+    """
+    Worker task: OCR one page of a PDF.
+
+    Returns ({'text', 'boxes'}, from_cache)
+    """
+    global _worker_cache, _worker_doc
+    import fitz
+
+    if _worker_cache is None:
+        _worker_cache = OCRCache()
+    if _worker_doc is None or _worker_doc[0] != file_path:
+        if _worker_doc is not None:
+            _worker_doc[1].close()
+        _worker_doc = (file_path, fitz.open(file_path))
+
+    pixmap = _worker_doc[1][page_index].get_pixmap(dpi=dpi)
+    key = OCRCache.make_key(pixmap.samples, lang, dpi)
+    page = _worker_cache.get_page(key)
+    if page is not None:
+        return page, True
+
+    import pytesseract
+    from PIL import Image
+
+    # get_pixmap renders RGB without alpha by default
+    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+    data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
+    page = _page_from_words(data, 72 / dpi)
+    _worker_cache.put_page(key, page)
+    return page, False
+
+
+def ocr_workers(concurrent_files: int = 1) -> int:
+    """
+    Tesseract processes per file: $REDACTION_OCR_WORKERS, or an even share
+    of the CPUs among `concurrent_files` files being OCRed at once
+    """
+    return max(1, int(os.getenv("REDACTION_OCR_WORKERS", (os.cpu_count() or 1) // max(1, concurrent_files))))
+
@@ -0,0 +1,51 @@
+"""Paragraph chunking shared by the line-based parsers (Text, Markdown)"""
+from typing import Dict, Iterable, Iterator
+
+# Paragraphs longer than this (e.g. log files without blank lines) are cut
+# at a line boundary so a chunk never grows without bound
+MAX_PARAGRAPH_CHARS = 20_000
+
+
+def iter_paragraphs(lines: Iterable[str], chunk_prefix: str, file_format: str,
+                    max_chars: int = MAX_PARAGRAPH_CHARS) -> Iterator[Dict]:
+    """
+    Group lines into paragraph chunks (separated by blank lines), holding
+    at most one paragraph in memory.
+
+    A paragraph cut because of `max_chars` yields pieces whose 'separator'
+    is a single newline, so writers can put the paragraph back together;
+    other chunks are followed by a blank line.
+    """
+    current = []
+    size = 0
+    chunk_num = 0
+    line_num = 0
+
+    def chunk(first_line: int, separator: str) -> Dict:
+        return {
+            'text': '\n'.join(current),
+            'line_start': first_line,
+            'chunk_id': f"{chunk_prefix}_{chunk_num}",
+            'format': file_format,
+            'separator': separator
+        }
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.rstrip()
+
+        if line.strip():
+            if current and size + len(line) > max_chars:
+                chunk_num += 1
+                yield chunk(line_num - len(current), '\n')
+                current, size = [], 0
+            current.append(line)
+            size += len(line) + 1
+        elif current:
+            # Empty line = end of paragraph
+            chunk_num += 1
+            yield chunk(line_num - len(current), '\n\n')
+            current, size = [], 0
+
+    if current:
+        chunk_num += 1
+        yield chunk(line_num - len(current) + 1, '\n\n')
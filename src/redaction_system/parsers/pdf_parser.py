@@ -1,13 +1,96 @@
 """PDF File Parser"""
-from typing import List, Dict
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-import pdfplumber
+from .ocr import ocr_available, ocr_page, ocr_workers
+
+# Pages extracted per worker task - large enough to amortize reopening the
+# PDF in the worker, small enough to keep every worker busy
+PAGES_PER_TASK = 50
+
+# Page ranges queued per worker; bounds how much extracted text waits to
+# be yielded in order
+TASKS_PER_WORKER = 2
+
+
+def _char_boxes(textmap) -> List[Optional[Tuple[float, float, float, float]]]:
+    """One (x0, top, x1, bottom) per character of `textmap.as_string`, None where no glyph backs it"""
+    boxes = []
+    for text, char in textmap.tuples:
+        box = (char['x0'], char['top'], char['x1'], char['bottom']) if char is not None else None
+        # Ligatures can expand to several characters of one glyph
+        boxes.extend([box] * len(text))
+    return boxes
+
+
+def _release_page(page):
+    """Drop pdfplumber's cached layout objects for a page we are done with"""
+    page.flush_cache()
+    cache_clear = getattr(page.get_textmap, 'cache_clear', None)
+    if cache_clear is not None:
+        cache_clear()
+
+
+def _iter_page_texts(file_path: str, start: int, stop: int,
+                     with_boxes: bool = False) -> Iterator[Tuple[int, str, Optional[List]]]:
+    """
+    Yield (page number, text, character boxes or None) for pages
+    [start, stop). Each page's cached layout objects are released as soon
+    as its text is out, so memory does not grow with the page count.
+    """
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        for index in range(start, stop):
+            page = pdf.pages[index]
+            if with_boxes:
+                # extract_text() is this textmap's string; the textmap also maps it to glyphs
+                textmap = page.get_textmap()
+                text, boxes = textmap.as_string, _char_boxes(textmap)
+            else:
+                text, boxes = page.extract_text() or '', None
+            _release_page(page)
+            yield index + 1, text, boxes
+
+
+def _has_images(file_path: str, index: int) -> bool:
+    """True if page `index` draws any image (so an empty text layer may hide text)"""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return bool(pdf.pages[index].images)
+
+
+def _extract_pages(file_path: str, start: int, stop: int, with_boxes: bool = False) -> List[Tuple[int, str, Optional[List]]]:
+    """Worker task: the texts of one page range"""
+    return list(_iter_page_texts(file_path, start, stop, with_boxes))
+
 
 class PDFParser:
     """Parse PDF files and extract text"""
     
-    def __init__(self):
+    def __init__(self, workers: int = 1, ocr: bool = None, ocr_workers: int = None):
+        """
+        Args:
+            workers: Processes extracting page ranges in parallel; 1 extracts
+                in-process
+            ocr: OCR pages without a text layer (default: on unless
+                $REDACTION_OCR is "0"); needs PyMuPDF, pytesseract and
+                tesseract. If OCR is on but unavailable, a file with an
+                image-only page fails rather than keep that page unredacted
+            ocr_workers: Tesseract processes (default: see ocr.ocr_workers)
+        """
         print("📄 Initializing PDFParser")
+        self.workers = max(1, workers)
+        if ocr is None:
+            ocr = os.getenv("REDACTION_OCR", "1") != "0"
+        self.ocr = ocr
+        self.ocr_workers = ocr_workers
+        self._ocr_checked = False
+        self._ocr_missing = False  # OCR was wanted but can't run here
     
     def parse(self, file_path: str) -> List[Dict]:
         """
@@ -19,6 +102,19 @@ class PDFParser:
         Returns:
             List of dicts with 'text', 'page', 'chunk_id'
         """
+        chunks = list(self.iter_chunks(file_path))
+        print(f"   ✅ Extracted {len(chunks)} pages from PDF")
+        return chunks
+    
+    def iter_chunks(self, file_path: str, with_boxes: bool = False) -> Iterator[Dict]:
+        """
+        Yield the same chunks as `parse` lazily and in page order. With
+        workers > 1, page ranges are extracted ahead on a process pool.
+        
+        Args:
+            with_boxes: Add 'boxes', the page position of every character of
+                'text' (for in-place redaction, see PDFChunkWriter)
+        """
         file_path = Path(file_path)
         
         if not file_path.exists():
@@ -28,25 +124,105 @@ class PDFParser:
             raise ValueError(f"Not a PDF file: {file_path}")
         
         print(f"🔍 Parsing PDF: {file_path.name}")
-        
-        chunks = []
-        
+        return self._iter_chunks(file_path, with_boxes)
+    
+    def _iter_chunks(self, file_path: Path, with_boxes: bool) -> Iterator[Dict]:
         try:
+            import pdfplumber
+            
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    
-                    if text.strip():
-                        chunks.append({
-                            'text': text,
-                            'page': page_num,
-                            'chunk_id': f"pdf_{page_num}",
-                            'format': 'pdf'
-                        })
+                page_count = len(pdf.pages)
             
-            print(f"   ✅ Extracted {len(chunks)} pages from PDF")
-            return chunks
+            if self.workers > 1 and page_count > PAGES_PER_TASK:
+                pages = self._iter_pages_parallel(str(file_path), page_count, with_boxes)
+            else:
+                pages = _iter_page_texts(str(file_path), 0, page_count, with_boxes)
             
+            for page_num, text, boxes, ocr in self._with_ocr(str(file_path), pages, with_boxes):
+                if text.strip():
+                    chunk = {
+                        'text': text,
+                        'page': page_num,
+                        'chunk_id': f"pdf_{page_num}",
+                        'format': 'pdf'
+                    }
+                    if with_boxes:
+                        chunk['boxes'] = boxes
+                    if ocr:
+                        chunk['ocr'] = True
+                    yield chunk
+        
         except Exception as e:
             raise RuntimeError(f"Error parsing PDF: {e}")
-
+    
+    def _iter_pages_parallel(self, file_path: str, page_count: int, with_boxes: bool) -> Iterator[Tuple[int, str, Optional[List]]]:
+        """Page ranges extracted on a pool, at most TASKS_PER_WORKER per worker ahead, yielded in order"""
+        ranges = ((start, min(start + PAGES_PER_TASK, page_count)) for start in range(0, page_count, PAGES_PER_TASK))
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            pending = deque(
+                pool.submit(_extract_pages, file_path, *r, with_boxes)
+                for r in islice(ranges, self.workers * TASKS_PER_WORKER)
+            )
+            while pending:
+                pages = pending.popleft().result()
+                for r in islice(ranges, 1):
+                    pending.append(pool.submit(_extract_pages, file_path, *r, with_boxes))
+                yield from pages
+        finally:
+            # Also when the consumer stops early: drop ranges not started yet
+            pool.shutdown(cancel_futures=True)
+    
+    def _can_ocr(self) -> bool:
+        if self.ocr and not self._ocr_checked:
+            self._ocr_checked = True
+            if not ocr_available():
+                print("   ⚠️  OCR unavailable (needs PyMuPDF, pytesseract and tesseract): "
+                      "PDFs with image-only pages will fail")
+                self.ocr = False
+                self._ocr_missing = True
+        return self.ocr
+    
+    def _with_ocr(self, file_path: str, pages, with_boxes: bool) -> Iterator[Tuple[int, str, Optional[List], bool]]:
+        """
+        Pass pages through, OCRing those without a text layer on a process
+        pool; yields (page number, text, boxes, OCRed) in page order. At
+        most TASKS_PER_WORKER pages per OCR worker wait ahead of the page
+        being yielded.
+        """
+        pool = None
+        workers = 1
+        pending = deque()  # (page number, text, boxes, OCR future or None)
+        ocred = cached = 0
+        
+        def resolve(entry):
+            nonlocal ocred, cached
+            page_num, text, boxes, future = entry
+            if future is None:
+                return page_num, text, boxes, False
+            page, from_cache = future.result()
+            ocred += 1
+            cached += from_cache
+            return page_num, page['text'], page['boxes'] if with_boxes else None, True
+        
+        try:
+            for page_num, text, boxes in pages:
+                future = None
+                if not text.strip() and self._can_ocr():
+                    if pool is None:
+                        workers = self.ocr_workers or ocr_workers()
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                    future = pool.submit(ocr_page, file_path, page_num - 1)
+                elif not text.strip() and self._ocr_missing and _has_images(file_path, page_num - 1):
+                    # Writing the page through would leave whatever text its image shows unredacted
+                    raise RuntimeError(f"page {page_num} has no text layer and OCR is unavailable "
+                                       f"(install pytesseract and tesseract, or set REDACTION_OCR=0 to keep such pages as they are)")
+                pending.append((page_num, text, boxes, future))
+                while pending and (pending[0][3] is None or len(pending) > workers * TASKS_PER_WORKER):
+                    yield resolve(pending.popleft())
+            while pending:
+                yield resolve(pending.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+                print(f"   🔎 OCR: {ocred} pages ({cached} from cache)")
@@ -1,5 +1,6 @@
 """Redaction System - Presidio Integration"""
 from .presidio_wrapper import PresidioRedactor
+from .nlp_profiles import NLP_PROFILES, NlpProfile
 
-__all__ = ['PresidioRedactor']
+__all__ = ['PresidioRedactor', 'NLP_PROFILES', 'NlpProfile']
 __version__ = '0.1.0'
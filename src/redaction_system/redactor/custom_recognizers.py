@@ -1,4 +1,6 @@
-from presidio_analyzer import PatternRecognizer, Pattern
+import re
+from typing import List, Optional
+from presidio_analyzer import PatternRecognizer, Pattern, RecognizerResult
 
 # Your CustomEntityPatterns class should be defined in the same file
 class CustomEntityPatterns:
@@ -22,19 +24,126 @@ class CustomEntityPatterns:
     BANK_ACCOUNT_PATTERN = r"\b\d{9,18}\b"
 
 
+# --- Validators --------------------------------------------------------------
+# Deterministic checks run before the confidence split: valid IDs become
+# certain, invalid ones are dropped, so neither reaches the LLM.
 
-def register_custom_recognizers(analyzer):
-    """Register all custom recognizers with Presidio analyzer."""
+# Verhoeff dihedral-group tables (used by UIDAI for the Aadhaar check digit)
+_VERHOEFF_D = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+]
+_VERHOEFF_P = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+    [5, 8, 0, 3, 7, 9, 6, 1, 4, 2],
+    [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+    [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
+    [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+    [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
+    [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
+]
+
+# 4th PAN character: holder type (Company, Person, HUF, Firm, AOP, Trust,
+# Body of Individuals, Local authority, Artificial Juridical person, Government)
+PAN_HOLDER_TYPES = set("CPHFATBLJG")
+
+_GSTIN_CHARSET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def verhoeff_valid(number: str) -> bool:
+    """True if the digit string carries a valid Verhoeff check digit"""
+    c = 0
+    for i, digit in enumerate(reversed(number)):
+        c = _VERHOEFF_D[c][_VERHOEFF_P[i % 8][int(digit)]]
+    return c == 0
+
+
+def pan_structure_valid(pan: str) -> bool:
+    """AAAAA9999A with a known holder type in the 4th position"""
+    return bool(re.fullmatch(CustomEntityPatterns.PAN_PATTERN, pan)) and pan[3] in PAN_HOLDER_TYPES
+
+
+def gstin_check_char(gstin: str) -> str:
+    """Expected 15th character of a GSTIN (mod-36 weighted checksum over the first 14)"""
+    total = 0
+    for i, ch in enumerate(gstin[:14]):
+        product = _GSTIN_CHARSET.index(ch) * (2 if i % 2 else 1)
+        total += product // 36 + product % 36
+    return _GSTIN_CHARSET[(36 - total % 36) % 36]
+
+
+class PANRecognizer(PatternRecognizer):
+    """PAN with structural rules: an unknown holder type (4th char) is dropped"""
+
+    def invalidate_result(self, pattern_text: str) -> Optional[bool]:
+        return not pan_structure_valid(pattern_text)
+
+
+class AadhaarRecognizer(PatternRecognizer):
+    """Aadhaar with Verhoeff check digit: valid -> certain, invalid -> dropped"""
+
+    def validate_result(self, pattern_text: str) -> Optional[bool]:
+        digits = re.sub(r"\D", "", pattern_text)
+        # UIDAI never issues numbers starting with 0 or 1
+        if len(digits) != 12 or digits[0] in "01":
+            return False
+        return verhoeff_valid(digits)
+
+
+class GSTRecognizer(PatternRecognizer):
+    """GSTIN with check character and embedded-PAN validation"""
+
+    def validate_result(self, pattern_text: str) -> Optional[bool]:
+        gstin = pattern_text.upper()
+        if not pan_structure_valid(gstin[2:12]):
+            return False
+        return gstin[14] == gstin_check_char(gstin)
+
+
+# Entities whose matches are checksum-validated; a BANK_ACCOUNT match on the
+# same digits is the same number seen by the looser 9-18 digit pattern
+_VALIDATED_NUMERIC_IDS = {"AADHAAR", "CREDIT_CARD"}
+
+
+def resolve_id_overlaps(results: List[RecognizerResult]) -> List[RecognizerResult]:
+    """Drop BANK_ACCOUNT candidates covered by a validated Aadhaar/credit-card match"""
+    validated = [
+        r for r in results
+        if r.entity_type in _VALIDATED_NUMERIC_IDS and r.score >= 1.0
+    ]
+    if not validated:
+        return results
+    return [
+        r for r in results
+        if not (
+            r.entity_type == "BANK_ACCOUNT"
+            and any(v.start <= r.start and r.end <= v.end for v in validated)
+        )
+    ]
+
+
+
+def register_custom_recognizers(registry):
+    """Register all custom recognizers with a Presidio RecognizerRegistry."""
     
     # PAN
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(PANRecognizer(
         supported_entity="PAN",
         patterns=[Pattern("PAN_PATTERN", CustomEntityPatterns.PAN_PATTERN, 0.85)],
         context=["PAN", "Permanent Account Number", "pan number"]
     ))
     
     # Aadhaar
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(AadhaarRecognizer(
         supported_entity="AADHAAR",
         patterns=[
             Pattern("AADHAAR_WITH_SPACES", CustomEntityPatterns.AADHAAR_WITH_SPACES, 0.9),
@@ -44,28 +153,28 @@ def register_custom_recognizers(analyzer):
     ))
     
     # IFSC
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(PatternRecognizer(
         supported_entity="IFSC",
         patterns=[Pattern("IFSC_PATTERN", CustomEntityPatterns.IFSC_PATTERN, 0.85)],
         context=["IFSC", "bank code", "branch code", "ifsc code"]
     ))
     
     # GST
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(GSTRecognizer(
         supported_entity="GST_REGISTRATION",
         patterns=[Pattern("GST_PATTERN", CustomEntityPatterns.GST_PATTERN, 0.9)],
         context=["GST", "GSTIN", "tax identification"]
     ))
     
     # CIN
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(PatternRecognizer(
         supported_entity="CIN",
         patterns=[Pattern("CIN_PATTERN", CustomEntityPatterns.CIN_PATTERN, 0.85)],
         context=["CIN", "corporate identification"]
     ))
     
     # Bank Account
-    analyzer.registry.add_recognizer(PatternRecognizer(
+    registry.add_recognizer(PatternRecognizer(
         supported_entity="BANK_ACCOUNT",
         patterns=[Pattern("BANK_ACCOUNT_PATTERN", CustomEntityPatterns.BANK_ACCOUNT_PATTERN, 0.5)],
         context=["account", "account number", "a/c", "bank account"]
@@ -0,0 +1,43 @@
+"""NLP Engine Profiles - trade spaCy accuracy for speed per job"""
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class NlpProfile:
+    """
+    spaCy settings for PresidioRedactor.
+
+    Attributes:
+        model: spaCy model package (downloaded by Presidio if missing)
+        disable: Pipeline components switched off after loading. Only the
+            parser may go: Presidio never reads it, while its context
+            enhancer matches every recognizer's context words (PAN, Aadhaar,
+            bank accounts...) against lemmas, so the lemmatizer (and the
+            tagger it relies on) must stay.
+        batch_size: Texts per batch when chunks are piped through spaCy
+    """
+    name: str
+    model: str
+    disable: Tuple[str, ...] = ()
+    batch_size: int = 64
+
+
+NLP_PROFILES = {
+    # Bulk jobs: small model, no dependency parse
+    'fast': NlpProfile('fast', 'en_core_web_sm', disable=('parser',), batch_size=256),
+    # Medium vectors
+    'balanced': NlpProfile('balanced', 'en_core_web_md', disable=('parser',), batch_size=128),
+    # Presidio's default model with the full pipeline
+    'accurate': NlpProfile('accurate', 'en_core_web_lg', batch_size=32),
+}
+
+DEFAULT_PROFILE = 'accurate'
+
+
+def get_profile(name: str = None) -> NlpProfile:
+    """Look up a profile by name (None = default)"""
+    name = name or DEFAULT_PROFILE
+    if name not in NLP_PROFILES:
+        raise ValueError(f"Unknown NLP profile: {name} (choose from {', '.join(NLP_PROFILES)})")
+    return NLP_PROFILES[name]
@@ -0,0 +1,159 @@
+"""Chunk Packing - analyze many small chunks as a few larger texts"""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, List, Sequence
+from presidio_analyzer import RecognizerResult
+from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
+
+# Default analysis unit size in characters. Big enough that one-line
+# chunks stop costing a Presidio/spaCy call each, small enough that a unit
+# stays a cheap spaCy doc
+PACK_CHARS = 2000
+
+# Joins chunks inside a unit: a paragraph break, which no recognizer
+# matches and spaCy treats as a sentence boundary. Results that still
+# touch it are not trusted (see analyze_packed). The U+2029 in the middle
+# keeps it apart from blank lines inside a chunk, so context words can be
+# clipped at it (see PackedContextEnhancer)
+PACK_SEPARATOR = "\n\n\u2029\n\n"
+
+
+class PackedContextEnhancer(LemmaContextAwareEnhancer):
+    """
+    Presidio's lemma context enhancer, with the context words of a result
+    taken only from the packed chunk it lies in. A neighbouring chunk's
+    words (say, a "Savings account" line before a bare number) would
+    otherwise raise scores that unpacked analysis leaves low. Texts without
+    PACK_SEPARATOR get exactly LemmaContextAwareEnhancer's context.
+    """
+
+    def _extract_surrounding_words(self, nlp_artifacts, word: str, start: int) -> List[str]:
+        text = nlp_artifacts.tokens.text if nlp_artifacts.tokens else ''
+        if PACK_SEPARATOR not in text:
+            return super()._extract_surrounding_words(nlp_artifacts, word, start)
+
+        left = text.rfind(PACK_SEPARATOR, 0, start)
+        chunk_start = left + len(PACK_SEPARATOR) if left >= 0 else 0
+        chunk_end = text.find(PACK_SEPARATOR, start)
+        if chunk_end < 0:
+            chunk_end = len(text)
+        first = bisect_left(nlp_artifacts.tokens_indices, chunk_start)
+        stop = bisect_left(nlp_artifacts.tokens_indices, chunk_end)
+        token_index = self._find_index_of_match_token(word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices)
+        if not first <= token_index < stop:
+            return super()._extract_surrounding_words(nlp_artifacts, word, start)
+
+        lemmas = nlp_artifacts.lemmas[first:stop]
+        context = self._add_n_words_backward(token_index - first, self.context_prefix_count, lemmas,
+                                             nlp_artifacts.keywords)
+        context += self._add_n_words_forward(token_index - first, self.context_suffix_count, lemmas,
+                                             nlp_artifacts.keywords)
+        return list(set(context))
+
+
+@dataclass
+class PackedUnit:
+    """One analysis text and where each of its chunks starts in it"""
+    indices: List[int] = field(default_factory=list)  # input positions of the chunks
+    starts: List[int] = field(default_factory=list)  # offset of each chunk in `text`
+    lengths: List[int] = field(default_factory=list)
+    parts: List[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return self.starts[-1] + self.lengths[-1] if self.starts else 0
+
+    @property
+    def text(self) -> str:
+        return PACK_SEPARATOR.join(self.parts)
+
+    def add(self, index: int, text: str):
+        self.starts.append(self.size + len(PACK_SEPARATOR) if self.starts else 0)
+        self.indices.append(index)
+        self.lengths.append(len(text))
+        self.parts.append(text)
+
+    def member_of(self, start: int, end: int):
+        """Position in `indices` of the chunk holding [start, end), or None if the span leaves it"""
+        k = bisect_right(self.starts, start) - 1
+        if k < 0 or end > self.starts[k] + self.lengths[k]:
+            return None
+        return k
+
+    def members_touched(self, start: int, end: int) -> range:
+        """Positions in `indices` of every chunk the span [start, end) reaches into or borders"""
+        first = max(0, bisect_right(self.starts, start) - 1)
+        last = max(first, bisect_right(self.starts, max(start, end - 1)) - 1)
+        if start >= self.starts[first] + self.lengths[first]:
+            # Starts in the separator after `first`: the chunk after is involved too
+            last = max(last, min(first + 1, len(self.starts) - 1))
+        return range(first, last + 1)
+
+
+def pack_texts(texts: Sequence[str], target_chars: int = PACK_CHARS) -> List[PackedUnit]:
+    """
+    Greedily group consecutive texts into units of at most `target_chars`
+    characters (separators included). A text longer than that gets a unit
+    of its own.
+    """
+    units = []
+    unit = PackedUnit()
+    for i, text in enumerate(texts):
+        if unit.starts and unit.size + len(PACK_SEPARATOR) + len(text) > target_chars:
+            units.append(unit)
+            unit = PackedUnit()
+        unit.add(i, text)
+    if unit.starts:
+        units.append(unit)
+    return units
+
+
+def analyze_packed(redactor, texts: Iterable[str], entities: List[str], score_threshold: float = 0.3,
+                   target_chars: int = PACK_CHARS) -> List[List[RecognizerResult]]:
+    """
+    `redactor.analyze_batch` over packed units instead of one text per
+    chunk, with every result mapped back to the chunk it lies in.
+
+    A result that crosses or touches a separator could only exist because
+    chunks were joined, so it is dropped and the chunks it touches are
+    analyzed again on their own; their packed results are discarded so each
+    chunk's results always come from a single analysis. Context words only
+    count within their own chunk when the redactor's analyzer uses
+    PackedContextEnhancer (PresidioRedactor does), so scores match unpacked
+    analysis too.
+
+    Args:
+        redactor: Anything with `analyze_batch` (PresidioRedactor, ParallelRedactor)
+        target_chars: Unit size; 0 or less analyzes every text on its own
+
+    Returns: One result list per text, in input order (same as analyze_batch)
+    """
+    texts = list(texts)
+    if target_chars <= 0 or len(texts) < 2:
+        return redactor.analyze_batch(texts, entities, score_threshold=score_threshold)
+
+    units = pack_texts(texts, target_chars)
+    if len(units) == len(texts):
+        # Nothing was merged
+        return redactor.analyze_batch(texts, entities, score_threshold=score_threshold)
+
+    results = [[] for _ in texts]
+    redo = set()
+    unit_results = redactor.analyze_batch((unit.text for unit in units), entities, score_threshold=score_threshold)
+    for unit, found in zip(units, unit_results):
+        for r in found:
+            k = unit.member_of(r.start, r.end)
+            if k is None:
+                redo.update(unit.indices[m] for m in unit.members_touched(r.start, r.end))
+                continue
+            r.start -= unit.starts[k]
+            r.end -= unit.starts[k]
+            results[unit.indices[k]].append(r)
+
+    if redo:
+        redo = sorted(redo)
+        print(f"   🔁 Re-analyzing {len(redo)} chunks alone (a match crossed a packing boundary)")
+        for i, chunk_results in zip(redo, redactor.analyze_batch((texts[i] for i in redo), entities,
+                                                                  score_threshold=score_threshold)):
+            results[i] = chunk_results
+    return results
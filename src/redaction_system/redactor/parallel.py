@@ -0,0 +1,109 @@
+"""Parallel Chunk Processing - fan analysis and anonymization out to worker processes"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence
+from presidio_analyzer import RecognizerResult
+from ..redactor.presidio_wrapper import PresidioRedactor
+
+# The PresidioRedactor used inside each worker process
+_worker_redactor = None
+
+# Slices per worker - small enough to balance uneven chunks, large enough
+# to keep spaCy batching and pickling overhead low
+SLICES_PER_WORKER = 4
+
+
+def _init_worker(language: str, profile: str):
+    """Spawned workers (no fork) build their own warm redactor"""
+    global _worker_redactor
+    _worker_redactor = PresidioRedactor(language=language, profile=profile)
+
+
+def _analyze_slice(texts: List[str], entities: List[str], score_threshold: float) -> List[List[RecognizerResult]]:
+    return _worker_redactor.analyze_batch(texts, entities, score_threshold=score_threshold)
+
+
+def _anonymize_slice(texts: List[str], results: List[List[RecognizerResult]]) -> List[str]:
+    return _worker_redactor.anonymize_batch(texts, results)
+
+
+def _slices(count: int, parts: int) -> List[slice]:
+    size = max(1, -(-count // parts))
+    return [slice(i, i + size) for i in range(0, count, size)]
+
+
+class ParallelRedactor:
+    """
+    Drop-in for PresidioRedactor.analyze_batch / anonymize_batch that splits
+    the chunk list into contiguous slices and runs them on a process pool.
+
+    Where fork is available the pool is started *after* the parent has
+    loaded everything the job needs (spaCy model, recognizers, anonymizer),
+    so workers share that memory copy-on-write instead of loading their own
+    copy. Elsewhere each worker builds a redactor once in its initializer.
+    Results always come back in input order.
+    """
+
+    def __init__(self, redactor: PresidioRedactor, workers: int):
+        self.redactor = redactor
+        self.workers = workers
+        self._pool = None
+        self._pool_has_model = False
+
+    def _get_pool(self, needs_nlp: bool) -> ProcessPoolExecutor:
+        global _worker_redactor
+
+        if self._pool is not None and needs_nlp and not self._pool_has_model:
+            # Forked before the model was loaded - re-fork so it is shared
+            self.close()
+
+        if self._pool is None:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                if needs_nlp:
+                    self.redactor.analyzer
+                self.redactor.anonymizer
+                _worker_redactor = self.redactor
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('fork')
+                )
+                self._pool_has_model = needs_nlp
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.redactor.language, self.redactor.profile.name)
+                )
+                self._pool_has_model = True
+            print(f"🧵 Started {self.workers} worker processes")
+        return self._pool
+
+    def analyze_batch(self, texts: Sequence[str], entities: List[str],
+                      score_threshold: float = 0.3) -> List[List[RecognizerResult]]:
+        texts = list(texts)
+        if len(texts) < 2:
+            return self.redactor.analyze_batch(texts, entities, score_threshold=score_threshold)
+
+        # Build the pattern engine (if any) before forking so workers inherit it
+        needs_nlp = self.redactor.pattern_engine_for(entities) is None
+        pool = self._get_pool(needs_nlp)
+
+        parts = _slices(len(texts), self.workers * SLICES_PER_WORKER)
+        futures = [pool.submit(_analyze_slice, texts[s], entities, score_threshold) for s in parts]
+        return [results for future in futures for results in future.result()]
+
+    def anonymize_batch(self, texts: Sequence[str], analyzer_results: Sequence[List[RecognizerResult]]) -> List[str]:
+        texts = list(texts)
+        analyzer_results = list(analyzer_results)
+        if len(texts) < 2:
+            return self.redactor.anonymize_batch(texts, analyzer_results)
+
+        pool = self._get_pool(needs_nlp=False)
+        parts = _slices(len(texts), self.workers * SLICES_PER_WORKER)
+        futures = [pool.submit(_anonymize_slice, texts[s], analyzer_results[s]) for s in parts]
+        return [text for future in futures for text in future.result()]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_has_model = False
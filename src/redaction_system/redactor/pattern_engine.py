@@ -0,0 +1,187 @@
+"""Pattern-Only Engine - single-pass regex analysis without the spaCy pipeline"""
+import re
+from typing import Dict, List, Optional
+from presidio_analyzer import AnalysisExplanation, PatternRecognizer, RecognizerResult, EntityRecognizer
+from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer, LemmaContextAwareEnhancer
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+# Same flags PatternRecognizer uses when the analyzer passes none
+DEFAULT_REGEX_FLAGS = re.DOTALL | re.MULTILINE
+
+_GLOBAL_INLINE_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Tokenizer-only spaCy pipelines per language, for context enhancement
+_blank_pipelines: Dict[str, object] = {}
+
+
+class _VocabLookup:
+    """The part of presidio's NlpEngine that NlpArtifacts needs to pick keywords, backed by a blank pipeline"""
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+
+    def is_stopword(self, word: str, language: str) -> bool:
+        return self.nlp.vocab[word].is_stop
+
+    def is_punct(self, word: str, language: str) -> bool:
+        return self.nlp.vocab[word].is_punct
+
+
+def token_artifacts(text: str, language: str = 'en') -> NlpArtifacts:
+    """
+    NlpArtifacts from spaCy's rule-based tokenizer alone (no model): the
+    tokens the NLP path would see, with each token's lowercase form as its
+    lemma. Context words are matched as substrings of these, so inflected
+    forms ("accounts") still hit their base context word.
+    """
+    nlp = _blank_pipelines.get(language)
+    if nlp is None:
+        import spacy
+        nlp = _blank_pipelines[language] = spacy.blank(language)
+    doc = nlp.make_doc(text)
+    return NlpArtifacts(
+        entities=[],
+        tokens=doc,
+        tokens_indices=[token.idx for token in doc],
+        lemmas=[token.lower_ for token in doc],
+        nlp_engine=_VocabLookup(nlp),
+        language=language
+    )
+
+
+def _scoped(regex: str) -> str:
+    """Turn a leading global inline flag group "(?i)..." into a scoped one so it can be alternated"""
+    m = _GLOBAL_INLINE_FLAGS.match(regex)
+    if m:
+        return f"(?{m.group(1)}:{regex[m.end():]})"
+    return f"(?:{regex})"
+
+
+class PatternOnlyEngine:
+    """
+    Regex-only analysis for entity sets served entirely by PatternRecognizers
+    (custom Indian IDs, EMAIL_ADDRESS, IP_ADDRESS, URL, ...).
+
+    All patterns are compiled into one combined scanner. The scanner finds
+    each position where *any* pattern matches; only there are the individual
+    patterns tried, so a chunk without hits costs a single regex pass and no
+    NLP at all. Results match PatternRecognizer semantics: validate_result /
+    invalidate_result are applied, and recognizer context words boost the
+    score through the same ContextAwareEnhancer the AnalyzerEngine uses, fed
+    with tokens from a blank (tokenizer-only) spaCy pipeline - so a PAN or
+    Aadhaar scores the same whether or not the job also needs NLP.
+    """
+
+    def __init__(self, recognizers: List[PatternRecognizer], context_enhancer: ContextAwareEnhancer = None,
+                 language: str = 'en', flags: int = DEFAULT_REGEX_FLAGS):
+        self.recognizers = recognizers
+        self.context_enhancer = context_enhancer or LemmaContextAwareEnhancer()
+        self.language = language
+
+        # (recognizer, pattern, compiled regex) in a fixed order
+        self._patterns = []
+        for recognizer in recognizers:
+            for pattern in recognizer.patterns:
+                self._patterns.append((recognizer, pattern, re.compile(pattern.regex, flags)))
+
+        self._scanner = re.compile("|".join(_scoped(p.regex) for _, p, _ in self._patterns), flags)
+        self._has_context_words = {recognizer.id: bool(recognizer.context) for recognizer in recognizers}
+
+    @staticmethod
+    def supports(recognizers: List[EntityRecognizer]) -> bool:
+        """True if every recognizer is a plain PatternRecognizer that needs no NLP artifacts"""
+        if not recognizers:
+            return False
+        for recognizer in recognizers:
+            if not isinstance(recognizer, PatternRecognizer):
+                return False
+            if type(recognizer).analyze is not PatternRecognizer.analyze:
+                return False  # custom analyze() may rely on NLP artifacts
+            if not recognizer.patterns:
+                return False
+            if any(_BACKREFERENCE.search(p.regex) for p in recognizer.patterns):
+                return False  # group numbers shift inside the combined scanner
+        return True
+
+    @classmethod
+    def build(cls, recognizers: List[EntityRecognizer], **kwargs) -> Optional["PatternOnlyEngine"]:
+        """Engine for these recognizers, or None if they need the NLP pipeline"""
+        if not cls.supports(recognizers):
+            return None
+        try:
+            return cls(recognizers, **kwargs)
+        except re.error:
+            return None
+
+    def analyze(self, text: str, score_threshold: float = 0.0) -> List[RecognizerResult]:
+        results = []
+        next_allowed = [0] * len(self._patterns)  # per-pattern finditer position
+        pos = 0
+
+        while True:
+            hit = self._scanner.search(text, pos)
+            if hit is None:
+                break
+            start = hit.start()
+
+            for i, (recognizer, pattern, regex) in enumerate(self._patterns):
+                if start < next_allowed[i]:
+                    continue
+                match = regex.match(text, start)
+                if match is None or match.end() == start:
+                    continue
+                next_allowed[i] = match.end()
+
+                result = self._score(text, recognizer, pattern, match)
+                if result is not None:
+                    results.append(result)
+
+            pos = start + 1
+
+        # Same order as AnalyzerEngine.analyze: context, duplicates, threshold
+        if any(self._has_context_words[r.recognition_metadata[RecognizerResult.RECOGNIZER_IDENTIFIER_KEY]]
+               for r in results):
+            results = self.context_enhancer.enhance_using_context(
+                text, results, token_artifacts(text, self.language), self.recognizers
+            )
+        results = EntityRecognizer.remove_duplicates(results)
+        for r in results:
+            # The AnalyzerEngine drops the decision process unless asked for it
+            r.analysis_explanation = None
+        return [r for r in results if r.score >= score_threshold]
+
+    def _score(self, text: str, recognizer: PatternRecognizer, pattern, match) -> Optional[RecognizerResult]:
+        start, end = match.span()
+        matched = text[start:end]
+        score = pattern.score
+
+        validation = recognizer.validate_result(matched)
+        if validation is not None:
+            score = EntityRecognizer.MAX_SCORE if validation else EntityRecognizer.MIN_SCORE
+        invalidation = recognizer.invalidate_result(matched)
+        if invalidation:
+            score = EntityRecognizer.MIN_SCORE
+        if score <= EntityRecognizer.MIN_SCORE:
+            return None
+
+        metadata = {
+            RecognizerResult.RECOGNIZER_NAME_KEY: recognizer.name,
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id,
+        }
+        # The context enhancer records the supportive word in the explanation
+        explanation = AnalysisExplanation(
+            recognizer=recognizer.name,
+            original_score=pattern.score,
+            pattern_name=pattern.name,
+            pattern=pattern.regex,
+            validation_result=validation
+        )
+        return RecognizerResult(
+            entity_type=recognizer.supported_entities[0],
+            start=start,
+            end=end,
+            score=score,
+            analysis_explanation=explanation,
+            recognition_metadata=metadata
+        )
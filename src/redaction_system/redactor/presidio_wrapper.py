@@ -1,30 +1,132 @@
 """Presidio PII Redaction Engine"""
-from typing import List
-from presidio_analyzer import AnalyzerEngine, RecognizerResult
-from presidio_anonymizer import AnonymizerEngine
+from typing import Iterable, List, Optional
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult, RecognizerRegistry
 from ..agent.prompt_interpreter import EntityConfig
-from ..redactor.custom_recognizers import register_custom_recognizers
+from ..redactor.custom_recognizers import register_custom_recognizers, resolve_id_overlaps
+from ..redactor.pattern_engine import PatternOnlyEngine
+from ..redactor.nlp_profiles import NlpProfile, get_profile
+from ..redactor.packing import PackedContextEnhancer
 
 class PresidioRedactor:
-    """Wrapper for Presidio Analyzer and Anonymizer"""
+    """
+    Wrapper for Presidio Analyzer and Anonymizer
     
-    def __init__(self, language: str = 'en'):
-        print(f"🔧 Initializing PresidioRedactor (language: {language})")
+    Construction is cheap: the recognizer registry is built up front (no
+    NLP needed), while the spaCy-backed AnalyzerEngine and the anonymizer
+    are created on first use. Pattern-only jobs never load a spaCy model.
+    """
+    
+    def __init__(self, language: str = 'en', profile: str = None):
+        """
+        Args:
+            language: Presidio language code
+            profile: NLP profile name - 'fast', 'balanced' or 'accurate'
+                (see redactor.nlp_profiles; default 'accurate')
+        """
+        self.profile: NlpProfile = get_profile(profile)
+        print(f"🔧 Initializing PresidioRedactor (language: {language}, profile: {self.profile.name})")
         self.language = language
-        self.analyzer = AnalyzerEngine()
-        self.anonymizer = AnonymizerEngine()
+        # Context words never cross chunk boundaries of packed texts (see redactor.packing)
+        self.context_aware_enhancer = PackedContextEnhancer()
+        
+        # Predefined + custom recognizers
+        self.registry = RecognizerRegistry()
+        self.registry.load_predefined_recognizers(languages=[language])
+        register_custom_recognizers(self.registry)
+        
+        self._analyzer = None
+        self._anonymizer = None
+        
+        # Pattern-only engines per requested entity set (None = needs NLP)
+        self._pattern_engines = {}
+
+    @property
+    def analyzer(self) -> AnalyzerEngine:
+        """Full Presidio analyzer - loads the spaCy model on first access"""
+        if self._analyzer is None:
+            print(f"🧠 Loading NLP engine ({self.profile.model})")
+            self._analyzer = AnalyzerEngine(
+                nlp_engine=self._create_nlp_engine(),
+                registry=self.registry,
+                supported_languages=[self.language],
+                context_aware_enhancer=self.context_aware_enhancer
+            )
+        return self._analyzer
+
+    def _create_nlp_engine(self):
+        from presidio_analyzer.nlp_engine import NlpEngineProvider
+        
+        nlp_engine = NlpEngineProvider(nlp_configuration={
+            "nlp_engine_name": "spacy",
+            "models": [{"lang_code": self.language, "model_name": self.profile.model}]
+        }).create_engine()
+        
+        nlp = nlp_engine.nlp[self.language]
+        disabled = [name for name in self.profile.disable if name in nlp.pipe_names]
+        if disabled:
+            nlp.select_pipes(disable=disabled)
+        nlp.batch_size = self.profile.batch_size
+        return nlp_engine
+
+    @property
+    def anonymizer(self):
+        if self._anonymizer is None:
+            from presidio_anonymizer import AnonymizerEngine
+            self._anonymizer = AnonymizerEngine()
+        return self._anonymizer
 
-        # Register custom recognizers
-        register_custom_recognizers(self.analyzer)
+    def pattern_engine_for(self, entities: List[str]) -> Optional[PatternOnlyEngine]:
+        """
+        Pattern-only engine if every recognizer for `entities` is regex-based,
+        otherwise None (the full spaCy pipeline is needed).
+        """
+        key = frozenset(entities)
+        if key not in self._pattern_engines:
+            recognizers = self.registry.get_recognizers(language=self.language, entities=list(entities))
+            engine = PatternOnlyEngine.build(
+                recognizers, context_enhancer=self.context_aware_enhancer, language=self.language
+            )
+            if engine is not None:
+                print(f"⚡ Pattern-only mode for {sorted(key)} (skipping spaCy)")
+            self._pattern_engines[key] = engine
+        return self._pattern_engines[key]
 
     def analyze(self, text: str, entities: List[str], score_threshold: float = 0.3) -> List[RecognizerResult]:
         """Step 1: Scan for PII candidates"""
-        return self.analyzer.analyze(
-            text=text,
-            entities=entities,
-            language=self.language,
-            score_threshold=score_threshold
-        )
+        engine = self.pattern_engine_for(entities)
+        if engine is not None:
+            results = engine.analyze(text, score_threshold=score_threshold)
+        else:
+            results = self.analyzer.analyze(
+                text=text,
+                entities=entities,
+                language=self.language,
+                score_threshold=score_threshold
+            )
+        return resolve_id_overlaps(results)
+
+    def analyze_batch(self, texts: Iterable[str], entities: List[str],
+                      score_threshold: float = 0.3) -> List[List[RecognizerResult]]:
+        """
+        Step 1 for many chunks at once.
+        
+        NLP jobs pipe the texts through spaCy in batches of the profile's
+        batch size instead of one call per chunk.
+        
+        Returns: One result list per text, in input order
+        """
+        texts = list(texts)
+        engine = self.pattern_engine_for(entities)
+        if engine is not None:
+            batch = [engine.analyze(text, score_threshold=score_threshold) for text in texts]
+        else:
+            batch = BatchAnalyzerEngine(analyzer_engine=self.analyzer).analyze_iterator(
+                texts,
+                language=self.language,
+                entities=entities,
+                score_threshold=score_threshold
+            )
+        return [resolve_id_overlaps(results) for results in batch]
     
     def anonymize(self, text: str, analyzer_results: List[RecognizerResult]) -> str:
         """Step 2: Replace PII with placeholders"""
@@ -37,6 +139,10 @@ class PresidioRedactor:
         )
         return result.text
 
+    def anonymize_batch(self, texts: Iterable[str], analyzer_results: Iterable[List[RecognizerResult]]) -> List[str]:
+        """Step 2 for many chunks - one redacted text per input text"""
+        return [self.anonymize(text, results) for text, results in zip(texts, analyzer_results)]
+
     def redact_text(self, text: str, config: EntityConfig) -> str:
         """Legacy method for simple redaction (no validation)"""
         results = self.analyze(text, config.entities)
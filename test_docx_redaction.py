@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""In-place DOCX redaction: run text edits and the streaming parser's segments"""
+import tempfile
+import zipfile
+from pathlib import Path
+
+from presidio_analyzer import RecognizerResult
+
+from redaction_system.orchestrator.writers import DOCXChunkWriter, segment_edits
+from redaction_system.parsers import DOCXParser
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _segments(*texts):
+    """Run segments as DOCXParser makes them; None marks a tab/break"""
+    segments, offset = [], 0
+    for text in texts:
+        if text is None:
+            segments.append((None, None, None, "\t"))
+        else:
+            segments.append((offset, offset + 1, "w:t", text))
+            offset += 10
+    return segments
+
+
+def test_span_inside_one_run():
+    edits = segment_edits(_segments("Call John now"), [RecognizerResult("PERSON", 5, 9, 0.9)])
+    assert [e[3] for e in edits] == ["Call <PERSON> now"]
+
+
+def test_span_across_runs():
+    # "John Smith" split over three runs: placeholder in the first, the rest removed
+    segments = _segments("Hi Jo", "hn Sm", "ith!")
+    edits = segment_edits(segments, [RecognizerResult("PERSON", 3, 13, 0.9)])
+    assert [e[3] for e in edits] == ["Hi <PERSON>", "", "!"]
+
+
+def test_untouched_runs_and_tabs():
+    segments = _segments("a@example.com", None, "kept")
+    edits = segment_edits(segments, [RecognizerResult("EMAIL_ADDRESS", 0, 13, 1.0)])
+    # Only changed runs are returned; the tab segment is never rewritten
+    assert [(e[0], e[3]) for e in edits] == [(0, "<EMAIL_ADDRESS>")]
+
+
+def test_overlapping_spans_keep_higher_score():
+    results = [RecognizerResult("BANK_ACCOUNT", 4, 16, 0.5), RecognizerResult("AADHAAR", 4, 18, 1.0)]
+    edits = segment_edits(_segments("ID: 2345 6789 0123."), results)
+    assert [e[3] for e in edits] == ["ID: <AADHAAR>."]
+
+
+def test_deleted_and_field_text_is_redacted():
+    document = (
+        f'<?xml version="1.0"?><w:document xmlns:w="{W_NS}"><w:body><w:p>'
+        '<w:r><w:t>Mail a@example.com</w:t></w:r>'
+        '<w:del><w:r><w:delText> old b@example.com</w:delText></w:r></w:del>'
+        '<w:r><w:instrText xml:space="preserve"> HYPERLINK "mailto:c@example.com" </w:instrText></w:r>'
+        '</w:p></w:body></w:document>'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        source, output = Path(tmp) / "in.docx", Path(tmp) / "out.docx"
+        with zipfile.ZipFile(source, "w") as package:
+            package.writestr("[Content_Types].xml", "<Types/>")
+            package.writestr("word/document.xml", document)
+
+        chunks = list(DOCXParser().iter_chunks(str(source)))
+        assert [s[2] for s in chunks[0]["segments"]] == ["w:t", "w:delText", "w:instrText"]
+
+        writer = DOCXChunkWriter(output, source)
+        for chunk in chunks:
+            text = chunk["text"]
+            results = []
+            for address in ("a@example.com", "b@example.com", "c@example.com"):
+                start = text.index(address)
+                results.append(RecognizerResult("EMAIL_ADDRESS", start, start + len(address), 1.0))
+            writer.write(chunk, None, results)
+        writer.close()
+
+        with zipfile.ZipFile(output) as package:
+            redacted = package.read("word/document.xml").decode("utf-8")
+            assert package.namelist() == ["[Content_Types].xml", "word/document.xml"]
+        assert "example.com" not in redacted
+        assert redacted.count("&lt;EMAIL_ADDRESS&gt;") == 3
+        assert "<w:delText" in redacted and "<w:instrText" in redacted
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Keyword fast path of Job 1 (prompt -> entity types without the LLM)"""
+from redaction_system.agent.intent_matcher import ALL_ENTITIES, match_prompt, normalize_prompt
+
+
+def test_single_entities():
+    assert match_prompt("redact names") == ["PERSON"]
+    assert match_prompt("Hide all e-mail addresses!") == ["EMAIL_ADDRESS"]
+    assert match_prompt("redact SSNs and phone numbers") == ["PHONE_NUMBER", "US_SSN"]
+    assert match_prompt("redact credit card numbers") == ["CREDIT_CARD"]
+
+
+def test_indian_id_phrasings():
+    assert match_prompt("redact PAN card numbers") == ["PAN"]
+    assert match_prompt("hide aadhaar card") == ["AADHAAR"]
+    assert match_prompt("mask bank account details and IFSC codes") == ["BANK_ACCOUNT", "IFSC"]
+
+
+def test_fillers_are_not_singularized():
+    assert match_prompt("redact names in this document") == ["PERSON"]
+    assert match_prompt("redact emails from this file") == ["EMAIL_ADDRESS"]
+
+
+def test_groups():
+    assert match_prompt("redact contact info") == ["EMAIL_ADDRESS", "PHONE_NUMBER", "LOCATION"]
+    assert match_prompt("redact all PII") == ALL_ENTITIES
+
+
+def test_defers_to_llm():
+    # Negations, unknown words and bare ambiguous words are the LLM's job
+    assert match_prompt("redact everything except names") is None
+    assert match_prompt("redact the patient's diagnosis") is None
+    assert match_prompt("redact cards") is None
+    assert match_prompt("redact names at this time") is None
+    assert match_prompt("") is None
+
+
+def test_normalize_prompt():
+    assert normalize_prompt("  Redact   NAMES, please! ") == "redact names please"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Chunk packing: unit layout, mapping results back, and chunk-local context"""
+import re
+
+from presidio_analyzer import RecognizerResult
+
+from redaction_system.redactor import PresidioRedactor
+from redaction_system.redactor.packing import PACK_SEPARATOR, PackedUnit, analyze_packed, pack_texts
+
+SEP = len(PACK_SEPARATOR)
+
+
+def _unit(*texts):
+    unit = PackedUnit()
+    for i, text in enumerate(texts):
+        unit.add(i, text)
+    return unit
+
+
+def test_pack_texts_respects_target():
+    texts = ["aaaa", "bbbb", "cccc", "x" * 30]
+    units = pack_texts(texts, target_chars=8 + SEP)
+    assert [u.indices for u in units] == [[0, 1], [2], [3]]
+    assert units[0].text == "aaaa" + PACK_SEPARATOR + "bbbb"
+    assert units[0].starts == [0, 4 + SEP]
+    # A text longer than the target gets a unit of its own
+    assert units[2].size == 30
+
+
+def test_member_of():
+    unit = _unit("abc", "defg")
+    second = 3 + SEP
+    assert unit.member_of(0, 3) == 0
+    assert unit.member_of(second, second + 4) == 1
+    assert unit.member_of(2, 4) is None  # runs into the separator
+    assert unit.member_of(3, second) is None  # the separator itself
+    assert unit.member_of(second - 1, second + 1) is None  # ends inside the next chunk
+
+
+def test_members_touched():
+    unit = _unit("abc", "defg", "hi")
+    second, third = 3 + SEP, 3 + SEP + 4 + SEP
+    assert list(unit.members_touched(1, second + 2)) == [0, 1]
+    # Starting in a separator involves the chunk after it
+    assert list(unit.members_touched(4, second + 1)) == [0, 1]
+    assert list(unit.members_touched(4, 5)) == [0, 1]
+    assert list(unit.members_touched(second + 3, third + 1)) == [1, 2]
+
+
+class _DigitRuns:
+    """Stand-in redactor: every run of digits and whitespace is a candidate"""
+
+    def analyze_batch(self, texts, entities, score_threshold=0.0):
+        return [[RecognizerResult("NUMBER", m.start(), m.end(), 0.5) for m in re.finditer(r"\d[\d\s]*\d|\d", text)]
+                for text in texts]
+
+
+def test_analyze_packed_maps_back_and_redoes_crossings():
+    texts = ["id 12", "34 end", "no digits", "n 7"]
+    packed = analyze_packed(_DigitRuns(), texts, ["NUMBER"], target_chars=1000)
+    alone = _DigitRuns().analyze_batch(texts, ["NUMBER"])
+    spans = lambda results: [(r.start, r.end, r.score) for r in results]
+    # "12" + separator + "34" matched as one run; both chunks were redone alone
+    assert [spans(r) for r in packed] == [spans(r) for r in alone]
+    assert spans(packed[3]) == [(2, 3, 0.5)]
+
+
+def test_context_stays_inside_packed_chunk():
+    redactor = PresidioRedactor()
+    texts = ["Savings account", "123456789012", "my bank account 987654321098 here", "nothing"]
+    entities = ["US_BANK_NUMBER"]
+    spans = lambda results: sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+    unpacked = analyze_packed(redactor, texts, entities, score_threshold=0.1, target_chars=0)
+    packed = analyze_packed(redactor, texts, entities, score_threshold=0.1, target_chars=2000)
+    # "account" in the first chunk must not raise the bare number in the second
+    assert packed[1] == unpacked[1] == []
+    assert [spans(r) for r in packed] == [spans(r) for r in unpacked]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
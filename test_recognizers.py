@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Checksum validation of Indian IDs (Aadhaar, PAN, GSTIN)"""
+from presidio_analyzer import RecognizerResult
+
+from redaction_system.redactor.custom_recognizers import (
+    gstin_check_char, pan_structure_valid, resolve_id_overlaps, verhoeff_valid
+)
+
+
+def test_verhoeff_valid():
+    assert verhoeff_valid("2363")  # textbook example: 236 -> check digit 3
+    assert verhoeff_valid("499118665246")
+    assert not verhoeff_valid("2364")
+    # Any single-digit change or adjacent transposition is caught
+    assert not verhoeff_valid("499118665247")
+    assert not verhoeff_valid("491918665246")
+
+
+def test_gstin_check_char():
+    for gstin in ("27AAPFU0939F1ZV", "29AAGCB7383J1Z4"):
+        assert gstin_check_char(gstin) == gstin[14]
+    assert gstin_check_char("27AAPFU0939F1ZV") != gstin_check_char("27AAPFU0939F2ZV")
+
+
+def test_pan_structure_valid():
+    assert pan_structure_valid("ABCPE1234F")
+    assert not pan_structure_valid("ABCXE1234F")  # X is not a holder type
+    assert not pan_structure_valid("ABCPE12345")
+
+
+def test_resolve_id_overlaps():
+    aadhaar = RecognizerResult("AADHAAR", 0, 14, 1.0)
+    bank = RecognizerResult("BANK_ACCOUNT", 0, 14, 0.5)
+    other = RecognizerResult("BANK_ACCOUNT", 20, 32, 0.5)
+    assert resolve_id_overlaps([aadhaar, bank, other]) == [aadhaar, other]
+    # An unvalidated Aadhaar match does not hide the bank account reading
+    weak = RecognizerResult("AADHAAR", 0, 14, 0.5)
+    assert resolve_id_overlaps([weak, bank]) == [weak, bank]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")